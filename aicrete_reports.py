@@ -0,0 +1,974 @@
+"""
+Report Generation Module for AIcrete UHPC Project
+Copyright 2025 Shiksha Seechurn / AIcrete
+
+This module renders the professional PDF reports (with cached matplotlib or
+vector charts) and the plain-text fallback. It has no Streamlit dependency so report rendering can
+run in worker processes for batch generation.
+"""
+
+import os
+import json
+import hashlib
+import zipfile
+import tempfile
+import threading
+from io import BytesIO
+from collections import OrderedDict
+from functools import partial
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend for report rendering
+from matplotlib.figure import Figure
+from reportlab.lib.pagesizes import letter, A4
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfbase.pdfdoc import PDFStream, PDFDictionary, PDFArray, PDFName, PDFZCompress
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib import colors
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.spider import SpiderChart
+from reportlab.graphics.charts.legends import Legend
+
+from mix_design import MixDesign, canonical_key
+from shared_cache import get_shared_cache
+
+# Chart quality tiers: raster DPI for embedded PNGs, or None for reportlab-native vector drawings
+CHART_QUALITY = {
+    'preview': 100,
+    'print': 300,
+    'vector': None
+}
+
+# Size of each chart on the page
+CHART_SIZES = {
+    'mix_composition': (5*inch, 3.75*inch),
+    'properties': (6*inch, 3.6*inch),
+    'radar': (5*inch, 5*inch)
+}
+
+PIE_COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD', '#98D8C8']
+PROPERTY_LABELS = ['Compressive\nStrength (MPa)', 'Flexural\nStrength (MPa)', 'Elastic Modulus\n(GPa)']
+PROPERTY_BENCHMARKS = [80, 8, 45]  # Typical UHPC targets
+RADAR_CATEGORIES = ['Strength\n(Compressive)', 'Ductility\n(Flexural)', 'Stiffness\n(Elastic)',
+                    'Durability\n(W/C Ratio)', 'Workability\n(SP Content)']
+
+CHART_CACHE_SIZE = 256
+CHART_RENDER_VERSION = 1  # bump when chart styling changes, so shared-cache PNGs are re-rendered
+_chart_cache = OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+def _render_mix_composition(data, dpi):
+    """Mix design pie chart as PNG bytes"""
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
+    materials, quantities = data['materials'], data['quantities']
+    
+    ax.pie(quantities, labels=materials, autopct='%1.1f%%',
+           colors=PIE_COLORS[:len(materials)], startangle=90)
+    ax.set_title('Mix Design Composition', fontsize=14, fontweight='bold', pad=20)
+    
+    return _figure_png(fig, dpi)
+
+def _render_properties(data, dpi):
+    """Predicted properties vs UHPC targets bar chart as PNG bytes"""
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    values = data['values']
+    
+    x = np.arange(len(PROPERTY_LABELS))
+    width = 0.35
+    
+    bars1 = ax.bar(x - width/2, values, width, label='Predicted Values', 
+                  color=['#FF6B6B', '#4ECDC4', '#45B7D1'], alpha=0.8)
+    ax.bar(x + width/2, PROPERTY_BENCHMARKS, width, label='UHPC Targets', 
+           color=['#FFA07A', '#98D8C8', '#87CEEB'], alpha=0.6)
+    
+    ax.set_xlabel('Properties', fontweight='bold')
+    ax.set_ylabel('Values', fontweight='bold')
+    ax.set_title('Predicted Properties vs UHPC Targets', fontsize=14, fontweight='bold', pad=20)
+    ax.set_xticks(x)
+    ax.set_xticklabels(PROPERTY_LABELS)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    
+    # Add value labels on bars
+    for bar in bars1:
+        height = bar.get_height()
+        ax.annotate(f'{height:.1f}',
+                   xy=(bar.get_x() + bar.get_width() / 2, height),
+                   xytext=(0, 3),  # 3 points vertical offset
+                   textcoords="offset points",
+                   ha='center', va='bottom', fontweight='bold')
+    
+    fig.tight_layout()
+    return _figure_png(fig, dpi)
+
+def _render_radar(data, dpi):
+    """Performance radar chart (0-10 scale) as PNG bytes"""
+    fig = Figure(figsize=(8, 8))
+    ax = fig.subplots(subplot_kw=dict(projection='polar'))
+    
+    # Add first value at end to close the polygon
+    values = list(data['scores'])
+    values += values[:1]
+    
+    # Calculate angles for each category
+    angles = np.linspace(0, 2 * np.pi, len(RADAR_CATEGORIES), endpoint=False).tolist()
+    angles += angles[:1]
+    
+    ax.plot(angles, values, 'o-', linewidth=2, label='Current Mix', color='#FF6B6B')
+    ax.fill(angles, values, alpha=0.25, color='#FF6B6B')
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(RADAR_CATEGORIES)
+    ax.set_ylim(0, 10)
+    ax.set_title('Performance Radar Chart\n(0-10 Scale)', size=14, fontweight='bold', pad=30)
+    ax.grid(True)
+    
+    # Add score labels
+    for angle, value in zip(angles[:-1], values[:-1]):
+        ax.text(angle, value + 0.5, f'{value:.1f}', ha='center', va='center', 
+               fontweight='bold', color='darkred')
+    
+    fig.tight_layout()
+    return _figure_png(fig, dpi)
+
+def _figure_png(fig, dpi):
+    """Rasterize a matplotlib figure"""
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+def _draw_title(drawing, title):
+    width, height = drawing.width, drawing.height
+    drawing.add(String(width / 2, height - 14, title, textAnchor='middle',
+                       fontName='Helvetica-Bold', fontSize=12))
+
+def _draw_mix_composition(data, width, height):
+    """Mix design pie chart as a vector reportlab drawing"""
+    drawing = Drawing(width, height)
+    quantities = data['quantities']
+    total = sum(quantities) or 1
+    
+    pie = Pie()
+    size = min(width, height) * 0.6
+    pie.x, pie.y = (width - size) / 2, (height - size) / 2 - 10
+    pie.width = pie.height = size
+    pie.data = quantities
+    pie.labels = [f"{m} ({q / total * 100:.1f}%)" for m, q in zip(data['materials'], quantities)]
+    pie.startAngle = 90
+    pie.direction = 'anticlockwise'
+    pie.slices.strokeColor = colors.white
+    pie.slices.fontSize = 7
+    for i in range(len(quantities)):
+        pie.slices[i].fillColor = colors.HexColor(PIE_COLORS[i % len(PIE_COLORS)])
+    
+    drawing.add(pie)
+    _draw_title(drawing, 'Mix Design Composition')
+    return drawing
+
+def _draw_properties(data, width, height):
+    """Predicted properties vs UHPC targets as a vector reportlab drawing"""
+    drawing = Drawing(width, height)
+    values = data['values']
+    
+    chart = VerticalBarChart()
+    chart.x, chart.y = 50, 45
+    chart.width, chart.height = width - 80, height - 90
+    chart.data = [values, PROPERTY_BENCHMARKS]
+    chart.categoryAxis.categoryNames = [label.replace('\n', ' ') for label in PROPERTY_LABELS]
+    chart.categoryAxis.labels.fontSize = 8
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.labels.fontSize = 8
+    chart.bars[0].fillColor = colors.HexColor('#FF6B6B')
+    chart.bars[1].fillColor = colors.HexColor('#87CEEB')
+    chart.barLabelArray = [[f'{v:.1f}' for v in values], [''] * len(PROPERTY_BENCHMARKS)]
+    chart.barLabels.nudge = 7
+    chart.barLabels.fontName = 'Helvetica-Bold'
+    chart.barLabels.fontSize = 8
+    
+    legend = Legend()
+    legend.x, legend.y = width - 150, height - 30
+    legend.fontSize = 8
+    legend.colorNamePairs = [(colors.HexColor('#FF6B6B'), 'Predicted Values'),
+                             (colors.HexColor('#87CEEB'), 'UHPC Targets')]
+    
+    drawing.add(chart)
+    drawing.add(legend)
+    _draw_title(drawing, 'Predicted Properties vs UHPC Targets')
+    return drawing
+
+def _draw_radar(data, width, height):
+    """Performance radar chart (0-10 scale) as a vector reportlab drawing"""
+    drawing = Drawing(width, height)
+    
+    chart = SpiderChart()
+    chart.x, chart.y = 60, 50
+    chart.width, chart.height = width - 120, height - 110
+    # An invisible full-scale strand pins the radial axis to 0-10
+    chart.data = [data['scores'], [10] * len(RADAR_CATEGORIES)]
+    chart.labels = [c.replace('\n', ' ') for c in RADAR_CATEGORIES]
+    chart.spokeLabels.fontSize = 8
+    chart.strands[0].strokeColor = colors.HexColor('#FF6B6B')
+    chart.strands[0].fillColor = colors.Color(1, 0.42, 0.42, alpha=0.25)
+    chart.strands[0].strokeWidth = 2
+    chart.strands[1].strokeColor = None
+    chart.strands[1].fillColor = None
+    
+    drawing.add(chart)
+    _draw_title(drawing, 'Performance Radar Chart (0-10 Scale)')
+    return drawing
+
+_CHART_RENDERERS = {
+    'mix_composition': (_render_mix_composition, _draw_mix_composition),
+    'properties': (_render_properties, _draw_properties),
+    'radar': (_render_radar, _draw_radar)
+}
+
+def chart_cache_key(chart_type, data, quality):
+    """Content address of a chart: chart type, (pre-rounded) inputs and quality tier"""
+    payload = json.dumps([chart_type, data, quality], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def chart_flowable(chart_type, data, quality='print'):
+    """Return a report flowable for a chart, rendering it only on a cache miss.
+
+    Callers round the inputs to display precision before calling, so identical
+    reports hit the cache instead of re-rasterizing the same figure.
+    """
+    if quality not in CHART_QUALITY:
+        raise ValueError(f"Unknown chart quality '{quality}' - expected one of {list(CHART_QUALITY)}")
+    
+    key = chart_cache_key(chart_type, data, quality)
+    with _chart_cache_lock:
+        entry = _chart_cache.get(key)
+        if entry is not None:
+            _chart_cache.move_to_end(key)
+    
+    raster_renderer, vector_renderer = _CHART_RENDERERS[chart_type]
+    width, height = CHART_SIZES[chart_type]
+    
+    if entry is None:
+        dpi = CHART_QUALITY[quality]
+        shared = get_shared_cache()
+        if dpi is None:
+            entry = vector_renderer(data, width, height)
+        elif shared is not None:
+            # PNGs rendered by any worker process are reused from the shared cache
+            entry = shared.get_or_compute('report_chart', CHART_RENDER_VERSION, [chart_type, data, quality],
+                                          lambda: raster_renderer(data, dpi))
+        else:
+            entry = raster_renderer(data, dpi)
+        with _chart_cache_lock:
+            _chart_cache[key] = entry
+            while len(_chart_cache) > CHART_CACHE_SIZE:
+                _chart_cache.popitem(last=False)
+    
+    if CHART_QUALITY[quality] is None:
+        # Drawings are mutable flowables - hand each story its own copy
+        return entry.copy()
+    return Image(BytesIO(entry), width=width, height=height)
+
+def mix_composition_data(mix_design):
+    """Pie chart inputs for a report mix (short keys), rounded so equal mixes share a cache entry"""
+    materials = []
+    quantities = []
+    material_mapping = {
+        'cement': 'Cement',
+        'silica': 'Silica Fume', 
+        'water': 'Water',
+        'sp': 'Superplasticizer',
+        'coarse': 'Coarse Aggregate',
+        'fine': 'Fine Aggregate',
+        'fibers': 'Steel Fibers'
+    }
+    
+    for key, label in material_mapping.items():
+        if mix_design.get(key, 0) > 0:
+            materials.append(label)
+            quantities.append(round(float(mix_design.get(key, 0)), 1))
+    return {'materials': materials, 'quantities': quantities}
+
+def prime_mix_charts(mix_designs, quality='print'):
+    """Render the composition charts for known mixes (e.g. the templates) into the chart cache"""
+    for mix_design in mix_designs:
+        chart_flowable('mix_composition', mix_composition_data(MixDesign.coerce(mix_design).report_dict()), quality)
+
+def clear_chart_cache():
+    """Drop all cached charts"""
+    with _chart_cache_lock:
+        _chart_cache.clear()
+
+def generate_pdf_report(predictions, mix_design, user_info=None, project_info=None, report_type="Prediction Summary Report",
+                        chart_quality="print"):
+    """Generate a professional PDF report with charts and graphs based on report type.
+
+    chart_quality selects a CHART_QUALITY tier: 'preview' / 'print' PNG rasters or
+    'vector' reportlab-native drawings. Charts are served from the figure cache.
+    """
+    # Layouts below read the short report keys whatever key set the caller used;
+    # ratios come from the MixDesign so they match the model's derived features
+    mix = MixDesign.coerce(mix_design)
+    mix_design = mix.report_dict()
+    try:
+        buffer = BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch)
+        styles = getSampleStyleSheet()
+        story = []
+        
+        # Custom styles
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            spaceAfter=30,
+            textColor=colors.darkblue,
+            alignment=1  # Center alignment
+        )
+        
+        header_style = ParagraphStyle(
+            'CustomHeader',
+            parent=styles['Heading2'],
+            fontSize=16,
+            spaceAfter=12,
+            textColor=colors.darkblue
+        )
+        
+        # Title based on report type
+        report_titles = {
+            "Prediction Summary Report": "AIcrete UHPC Prediction Summary",
+            "Cost Analysis Report": "AIcrete UHPC Cost Analysis Report", 
+            "Optimization Report": "AIcrete UHPC Mix Optimization Report",
+            "Comparative Analysis": "AIcrete UHPC Comparative Analysis",
+            "Executive Summary": "AIcrete UHPC Executive Summary",
+            "Technical Analysis Report": "AIcrete UHPC Technical Analysis"
+        }
+        
+        title = report_titles.get(report_type, "AIcrete UHPC Analysis Report")
+        story.append(Paragraph(title, title_style))
+        story.append(Spacer(1, 20))
+        
+        # Report metadata
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        story.append(Paragraph(f"<b>Generated:</b> {current_time}", styles['Normal']))
+        
+        if project_info:
+            story.append(Paragraph(f"<b>Project:</b> {project_info.get('name', 'N/A')}", styles['Normal']))
+            story.append(Paragraph(f"<b>Engineer:</b> {project_info.get('engineer', 'N/A')}", styles['Normal']))
+        
+        story.append(Spacer(1, 20))
+        
+        # Add report-specific content based on type
+        if report_type == "Cost Analysis Report":
+            story.append(Paragraph("Cost Analysis Overview", header_style))
+            
+            # Calculate costs
+            cement_cost = mix_design.get('cement', 0) * 0.12  # $0.12 per kg
+            silica_cost = mix_design.get('silica', 0) * 0.85  # $0.85 per kg
+            sp_cost = mix_design.get('sp', 0) * 2.50  # $2.50 per kg
+            aggregate_cost = (mix_design.get('coarse', 0) + mix_design.get('fine', 0)) * 0.025  # $0.025 per kg
+            fiber_cost = mix_design.get('fibers', 0) * 8.50  # $8.50 per kg
+            
+            total_material_cost = cement_cost + silica_cost + sp_cost + aggregate_cost + fiber_cost
+            
+            cost_data = [
+                ['Material', 'Quantity (kg/m³)', 'Unit Cost ($/kg)', 'Total Cost ($/m³)'],
+                ['Cement', f"{mix_design.get('cement', 0):.1f}", '$0.12', f"${cement_cost:.2f}"],
+                ['Silica Fume', f"{mix_design.get('silica', 0):.1f}", '$0.85', f"${silica_cost:.2f}"],
+                ['Superplasticizer', f"{mix_design.get('sp', 0):.1f}", '$2.50', f"${sp_cost:.2f}"],
+                ['Aggregates', f"{mix_design.get('coarse', 0) + mix_design.get('fine', 0):.1f}", '$0.025', f"${aggregate_cost:.2f}"],
+                ['Steel Fibers', f"{mix_design.get('fibers', 0):.1f}", '$8.50', f"${fiber_cost:.2f}"],
+                ['', '', 'TOTAL:', f"${total_material_cost:.2f}"]
+            ]
+            
+            cost_table = Table(cost_data)
+            cost_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.darkred),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+                ('BACKGROUND', (0, -1), (-1, -1), colors.lightcoral),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -2), colors.mistyrose),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]))
+            
+            story.append(cost_table)
+            story.append(Spacer(1, 20))
+            
+            cost_analysis = f"""
+            <b>Cost Analysis Summary:</b><br/>
+            • Material cost per m³: ${total_material_cost:.2f}<br/>
+            • Estimated production cost: ${total_material_cost * 1.3:.2f} (including labor & overhead)<br/>
+            • Cost comparison: {'Premium UHPC' if total_material_cost > 150 else 'Standard UHPC' if total_material_cost > 100 else 'Economy UHPC'}<br/>
+            • Primary cost drivers: {'Steel Fibers' if fiber_cost > cement_cost else 'Cement & Silica Fume'}<br/>
+            """
+            story.append(Paragraph(cost_analysis, styles['Normal']))
+            story.append(Spacer(1, 20))
+            
+        elif report_type == "Executive Summary":
+            story.append(Paragraph("Executive Summary", header_style))
+            
+            executive_text = f"""
+            <b>Project Overview:</b><br/>
+            This report presents the concrete mix design analysis and performance predictions for Ultra-High Performance Concrete (UHPC) formulation.<br/><br/>
+            
+            <b>Key Findings:</b><br/>
+            • Predicted compressive strength: {predictions.get('strength', 0):.1f} MPa<br/>
+            • Performance rating: {'Excellent' if predictions.get('strength', 0) > 80 else 'Good' if predictions.get('strength', 0) > 50 else 'Adequate'}<br/>
+            • Mix classification: {'High-strength UHPC' if predictions.get('strength', 0) > 100 else 'Standard UHPC'}<br/><br/>
+            
+            <b>Business Impact:</b><br/>
+            • Structural efficiency: Enhanced load-bearing capacity<br/>
+            • Durability: Extended service life reduces maintenance costs<br/>
+            • Sustainability: Optimized material usage reduces environmental impact<br/>
+            """
+            story.append(Paragraph(executive_text, styles['Normal']))
+            story.append(Spacer(1, 20))
+            
+        elif report_type == "Optimization Report":
+            story.append(Paragraph("Mix Design Optimization Analysis", header_style))
+            
+            w_c_ratio = mix.w_c_ratio
+            binder_ratio = mix.sf_c_ratio
+            
+            optimization_text = f"""
+            <b>Current Mix Parameters:</b><br/>
+            • Water-Cement Ratio: {w_c_ratio:.3f}<br/>
+            • Silica Fume Replacement: {(binder_ratio * 100):.1f}%<br/>
+            • Fiber Content: {mix_design.get('fibers', 0):.1f} kg/m³<br/><br/>
+            
+            <b>Optimization Recommendations:</b><br/>
+            • {'✓ W/C ratio is optimal' if w_c_ratio < 0.35 else '→ Reduce W/C ratio to < 0.35 for better durability'}<br/>
+            • {'✓ Silica fume content is adequate' if binder_ratio > 0.15 else '→ Increase silica fume to 15-25% replacement'}<br/>
+            • {'✓ Fiber content is optimal' if mix_design.get('fibers', 0) > 78 else '→ Consider increasing fiber content to 78-150 kg/m³'}<br/>
+            """
+            story.append(Paragraph(optimization_text, styles['Normal']))
+            story.append(Spacer(1, 20))
+            
+        elif report_type == "Comparative Analysis":
+            story.append(Paragraph("Comparative Performance Analysis", header_style))
+            
+            comparison_data = [
+                ['Property', 'Current Mix', 'Standard Concrete', 'High-Strength Concrete', 'Performance Ratio'],
+                ['Compressive Strength (MPa)', f"{predictions.get('strength', 0):.1f}", '30', '50', 
+                 f"{predictions.get('strength', 0)/30:.1f}x"],
+                ['Flexural Strength (MPa)', f"{predictions.get('flexural', 0):.1f}", '4', '6',
+                 f"{predictions.get('flexural', 0)/4:.1f}x"],
+                ['Elastic Modulus (GPa)', f"{predictions.get('elastic', 0):.1f}", '30', '35',
+                 f"{predictions.get('elastic', 0)/30:.1f}x"]
+            ]
+            
+            comparison_table = Table(comparison_data)
+            comparison_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]))
+            
+            story.append(comparison_table)
+            story.append(Spacer(1, 20))
+        
+        # Continue with standard charts and analysis for all report types
+        
+        # Create Mix Design Pie Chart
+        try:
+            chart_image = chart_flowable('mix_composition', mix_composition_data(mix_design), chart_quality)
+            
+            # Add chart to PDF
+            story.append(Paragraph("Mix Design Composition", header_style))
+            story.append(Spacer(1, 10))
+            story.append(chart_image)
+            story.append(Spacer(1, 20))
+            
+        except Exception as e:
+            # If chart creation fails, add text note
+            story.append(Paragraph("Mix Design Composition", header_style))
+            story.append(Paragraph("(Chart generation temporarily unavailable)", styles['Normal']))
+            story.append(Spacer(1, 10))
+        
+        # Mix Design Table
+        # Calculate total mass excluding non-material parameters
+        material_params = {k: v for k, v in mix_design.items() 
+                         if k not in ['age', 'temp', 'humidity', 'curing_temperature', 'curing_humidity']}
+        total_mass = sum(material_params.values()) if material_params else 1
+        
+        mix_data = [
+            ['Component', 'Quantity (kg/m³)', 'Percentage (%)'],
+            ['Cement', f"{mix_design.get('cement', 0):.1f}", f"{(mix_design.get('cement', 0)/total_mass*100):.1f}"],
+            ['Silica Fume', f"{mix_design.get('silica', 0):.1f}", f"{(mix_design.get('silica', 0)/total_mass*100):.1f}"],
+            ['Water', f"{mix_design.get('water', 0):.1f}", f"{(mix_design.get('water', 0)/total_mass*100):.1f}"],
+            ['Superplasticizer', f"{mix_design.get('sp', 0):.1f}", f"{(mix_design.get('sp', 0)/total_mass*100):.1f}"],
+            ['Coarse Aggregate', f"{mix_design.get('coarse', 0):.1f}", f"{(mix_design.get('coarse', 0)/total_mass*100):.1f}"],
+            ['Fine Aggregate', f"{mix_design.get('fine', 0):.1f}", f"{(mix_design.get('fine', 0)/total_mass*100):.1f}"],
+            ['Steel Fibers', f"{mix_design.get('fibers', 0):.1f}", f"{(mix_design.get('fibers', 0)/total_mass*100):.1f}"],
+        ]
+        
+        mix_table = Table(mix_data)
+        mix_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]))
+        
+        story.append(mix_table)
+        story.append(Spacer(1, 30))
+        
+        # Create Properties Bar Chart
+        try:
+            values = [
+                round(float(predictions.get('strength', 0)), 1),
+                round(float(predictions.get('flexural', 0)), 1), 
+                round(float(predictions.get('elastic', 0)), 1)
+            ]
+            
+            props_chart_image = chart_flowable('properties', {'values': values}, chart_quality)
+            
+            # Add chart to PDF
+            story.append(Paragraph("Predicted Properties Analysis", header_style))
+            story.append(Spacer(1, 10))
+            story.append(props_chart_image)
+            story.append(Spacer(1, 20))
+            
+        except Exception as e:
+            # If chart creation fails, add text note
+            story.append(Paragraph("Predicted Properties Analysis", header_style))
+            story.append(Paragraph("(Chart generation temporarily unavailable)", styles['Normal']))
+            story.append(Spacer(1, 10))
+        
+        # Predictions Table
+        pred_data = [
+            ['Property', 'Predicted Value', 'Unit', 'Performance Rating'],
+            ['Compressive Strength', f"{predictions.get('strength', 0):.1f}", 'MPa', 
+             'Excellent' if predictions.get('strength', 0) > 80 else 'Good' if predictions.get('strength', 0) > 50 else 'Adequate'],
+            ['Flexural Strength', f"{predictions.get('flexural', 0):.1f}", 'MPa',
+             'High' if predictions.get('flexural', 0) > 8 else 'Standard'],
+            ['Elastic Modulus', f"{predictions.get('elastic', 0):.0f}", 'GPa',
+             'High Stiffness' if predictions.get('elastic', 0) > 40 else 'Normal'],
+        ]
+        
+        pred_table = Table(pred_data)
+        pred_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]))
+        
+        story.append(pred_table)
+        story.append(Spacer(1, 30))
+        
+        # Create Performance Radar Chart
+        try:
+            # Normalize values to 0-10 scale
+            strength_score = min(predictions.get('strength', 0) / 10, 10)
+            flexural_score = min(predictions.get('flexural', 0) * 1.25, 10)
+            elastic_score = min(predictions.get('elastic', 0) / 5, 10)
+            durability_score = max(10 - mix.w_c_ratio * 20, 0)  # Lower W/C = higher score
+            workability_score = min(mix_design.get('sp', 0) / 2, 10)
+            
+            scores = [round(float(v), 1) for v in
+                      [strength_score, flexural_score, elastic_score, durability_score, workability_score]]
+            
+            radar_chart_image = chart_flowable('radar', {'scores': scores}, chart_quality)
+            
+            # Add chart to PDF
+            story.append(Paragraph("Performance Assessment", header_style))
+            story.append(Spacer(1, 10))
+            story.append(radar_chart_image)
+            story.append(Spacer(1, 20))
+            
+        except Exception as e:
+            # If chart creation fails, add text note
+            story.append(Paragraph("Performance Assessment", header_style))
+            story.append(Paragraph("(Radar chart generation temporarily unavailable)", styles['Normal']))
+            story.append(Spacer(1, 10))
+        
+        # Engineering Analysis
+        story.append(Paragraph("Engineering Analysis", header_style))
+        
+        w_c_ratio = mix.w_c_ratio
+        binder_content = mix.total_binder
+        
+        analysis_text = f"""
+        <b>Water-Cement Ratio:</b> {w_c_ratio:.3f}<br/>
+        <b>Total Binder Content:</b> {binder_content:.1f} kg/m³<br/>
+        <b>Fiber Volume Fraction:</b> {mix.fiber_volume_fraction:.2f}%<br/>
+        <br/>
+        <b>Performance Assessment:</b><br/>
+        • W/C Ratio: {'Excellent (Low)' if w_c_ratio < 0.35 else 'Good' if w_c_ratio < 0.45 else 'Adequate'}<br/>
+        • Binder Content: {'High Performance' if binder_content > 550 else 'Standard' if binder_content > 450 else 'Economy'}<br/>
+        • Fiber Reinforcement: {'High' if mix_design.get('fibers', 0) > 100 else 'Standard' if mix_design.get('fibers', 0) > 50 else 'Light'}<br/>
+        """
+        
+        story.append(Paragraph(analysis_text, styles['Normal']))
+        story.append(Spacer(1, 20))
+        
+        # Recommendations
+        story.append(Paragraph("Engineering Recommendations", header_style))
+        
+        recommendations = []
+        if w_c_ratio > 0.45:
+            recommendations.append("• Consider reducing water content for improved durability")
+        if mix_design.get('fibers', 0) < 78:
+            recommendations.append("• Increase fiber content for better toughness")
+        if predictions.get('strength', 0) < 50:
+            recommendations.append("• Increase cement or add more silica fume for higher strength")
+        
+        if not recommendations:
+            recommendations.append("• Mix design appears well-optimized for UHPC applications")
+            recommendations.append("• Consider long-term durability testing for critical applications")
+        
+        for rec in recommendations:
+            story.append(Paragraph(rec, styles['Normal']))
+        
+        story.append(Spacer(1, 20))
+        
+        # Footer
+        story.append(Paragraph("Generated by AIcrete Professional - Advanced Concrete Engineering Platform", 
+                              styles['Normal']))
+        
+        doc.build(story)
+        buffer.seek(0)
+        return buffer
+        
+    except Exception as e:
+        # If reportlab fails, create a simple text report
+        return generate_simple_text_report(predictions, mix_design, project_info)
+        story.append(Paragraph("Generated by AIcrete Professional - Advanced Concrete Engineering Platform", 
+                              styles['Normal']))
+        
+        doc.build(story)
+        buffer.seek(0)
+        return buffer
+        
+    except Exception as e:
+        # If reportlab fails, create a simple text report
+        return generate_simple_text_report(predictions, mix_design, project_info)
+
+def generate_simple_text_report(predictions, mix_design, project_info=None):
+    """Generate a simple text-based report as fallback"""
+    mix = MixDesign.coerce(mix_design)
+    mix_design = mix.report_dict()
+    buffer = BytesIO()
+    
+    report_content = f"""
+AIcrete UHPC Analysis Report
+============================
+
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Project: {project_info.get('name', 'UHPC Analysis') if project_info else 'UHPC Analysis'}
+Engineer: {project_info.get('engineer', 'AIcrete User') if project_info else 'AIcrete User'}
+
+Mix Design Composition
+======================
+Cement: {mix_design.get('cement', 0):.1f} kg/m³
+Silica Fume: {mix_design.get('silica', 0):.1f} kg/m³
+Water: {mix_design.get('water', 0):.1f} kg/m³
+Superplasticizer: {mix_design.get('sp', 0):.1f} kg/m³
+Coarse Aggregate: {mix_design.get('coarse', 0):.1f} kg/m³
+Fine Aggregate: {mix_design.get('fine', 0):.1f} kg/m³
+Steel Fibers: {mix_design.get('fibers', 0):.1f} kg/m³
+
+Predicted Properties
+===================
+Compressive Strength: {predictions.get('strength', 0):.1f} MPa
+Flexural Strength: {predictions.get('flexural', 0):.1f} MPa
+Elastic Modulus: {predictions.get('elastic', 0):.1f} GPa
+
+Engineering Analysis
+===================
+Water-Cement Ratio: {mix.w_c_ratio:.3f}
+Total Binder Content: {mix.total_binder:.1f} kg/m³
+
+Generated by AIcrete Professional
+Advanced Concrete Engineering Platform
+"""
+    
+    buffer.write(report_content.encode('utf-8'))
+    buffer.seek(0)
+    return buffer
+
+def report_inputs(mix_data, predictions):
+    """Map a predictor mix and prediction dict onto the keys generate_pdf_report expects"""
+    mix_design = MixDesign.coerce(mix_data).report_dict()
+    report_predictions = {
+        'strength': predictions.get('compressive_strength', 0),
+        'flexural': predictions.get('tensile_strength', 0),
+        'elastic': predictions.get('elastic_modulus', 0)
+    }
+    return report_predictions, mix_design
+
+def render_report_job(job):
+    """Render a single batch job; top-level so it can run in a worker process"""
+    buffer = generate_pdf_report(job['predictions'], job['mix_design'],
+                                 project_info=job.get('project_info'),
+                                 report_type=job['report_type'],
+                                 chart_quality=job.get('chart_quality', 'print'))
+    content = buffer.getvalue()
+    # generate_pdf_report falls back to a plain-text report if reportlab fails
+    extension = 'pdf' if content.startswith(b'%PDF') else 'txt'
+    safe_name = "".join(c if c.isalnum() or c in '-_' else '_' for c in job['name'])
+    filename = f"{safe_name}/AIcrete_{job['report_type'].replace(' ', '_')}.{extension}"
+    return filename, content
+
+def generate_report_archive(jobs, max_workers=None, progress_callback=None, output=None):
+    """Render many reports in parallel and stream them into a ZIP archive.
+
+    Chart rasterization and PDF layout are CPU-bound and hold the GIL, so jobs
+    are spread across a process pool. Each report is written to the archive as
+    soon as it completes, into output (default: a spooled temporary file that
+    spills to disk once it grows large). Returns the archive file object
+    positioned at the start of the ZIP data.
+    """
+    archive = output if output is not None else tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024)
+    total = len(jobs)
+    workers = min(max_workers or os.cpu_count() or 1, total)
+
+    with zipfile.ZipFile(archive, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        if workers <= 1:
+            # Single job or single core - not worth the pool start-up cost
+            for done, job in enumerate(jobs, start=1):
+                filename, content = render_report_job(job)
+                zf.writestr(filename, content)
+                if progress_callback:
+                    progress_callback(done, total, filename)
+        else:
+            # Spawn rather than fork: the Streamlit server process is multi-threaded
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                futures = [executor.submit(render_report_job, job) for job in jobs]
+                for done, future in enumerate(as_completed(futures), start=1):
+                    filename, content = future.result()
+                    zf.writestr(filename, content)
+                    if progress_callback:
+                        progress_callback(done, total, filename)
+
+    archive.seek(0)
+    return archive
+
+# Columns tabled by the multi-mix appendix: (key, header, format)
+MULTI_MIX_COLUMNS = [
+    ('cement', 'Cement', '{:.0f}'),
+    ('silica_fume', 'Silica\nFume', '{:.0f}'),
+    ('water', 'Water', '{:.0f}'),
+    ('superplasticizer', 'SP', '{:.1f}'),
+    ('steel_fibers', 'Fibers', '{:.0f}'),
+    ('compressive_strength', 'f\'c\n(MPa)', '{:.1f}'),
+    ('tensile_strength', 'Tensile\n(MPa)', '{:.2f}'),
+    ('elastic_modulus', 'E\n(GPa)', '{:.1f}'),
+    ('UPV', 'UPV\n(m/s)', '{:.0f}'),
+    ('cost', 'Cost\n($/m³)', '{:.0f}')
+]
+MULTI_MIX_SUMMARY = ['compressive_strength', 'tensile_strength', 'elastic_modulus', 'UPV', 'cost']
+
+class _SpooledPageStream(PDFStream):
+    """Page content stream kept compressed in a spool file until the PDF is assembled"""
+    def __init__(self, spool, offset, length):
+        dictionary = PDFDictionary()
+        dictionary['Filter'] = PDFArray([PDFName(PDFZCompress.pdfname)])
+        PDFStream.__init__(self, dictionary)
+        self.__Comment__ = "page stream"
+        self._spool, self._offset, self._length = spool, offset, length
+
+    def format(self, document):
+        self._spool.seek(self._offset)
+        self.content = self._spool.read(self._length)
+        try:
+            return PDFStream.format(self, document)
+        finally:
+            self.content = None
+
+class _SpoolingCanvas(Canvas):
+    """Canvas that flushes finished pages to a temporary file every page_chunk pages.
+
+    reportlab holds each page's raw drawing operators until save(); for long
+    appendices those dominate memory, so completed pages are compressed and
+    moved out to disk in chunks.
+    """
+    def __init__(self, *args, page_chunk=25, **kwargs):
+        Canvas.__init__(self, *args, **kwargs)
+        self.page_chunk = page_chunk
+        self._spool = tempfile.TemporaryFile()
+        self._flushed_pages = 0
+
+    def showPage(self):
+        Canvas.showPage(self)
+        if self.getPageNumber() - 1 - self._flushed_pages >= self.page_chunk:
+            self._flush_pages()
+
+    def _flush_pages(self):
+        pages = self._doc.Pages.pages
+        for page in pages[self._flushed_pages:]:
+            if page.stream and not page.Contents:
+                data = PDFZCompress.encode(page.stream)
+                self._spool.seek(0, os.SEEK_END)
+                page.Contents = _SpooledPageStream(self._spool, self._spool.tell(), len(data))
+                self._spool.write(data)
+                page.stream = None
+        self._flushed_pages = len(pages)
+
+    def save(self):
+        try:
+            Canvas.save(self)
+        finally:
+            self._spool.close()
+
+class _LazyStory(list):
+    """Flowable list that refills itself from a generator as the document is laid out.
+
+    BaseDocTemplate.build consumes flowables from the front while len() > 0, so
+    only the blocks currently being placed are ever materialized.
+    """
+    def __init__(self, flowables, lookahead=4):
+        list.__init__(self)
+        self._source = iter(flowables)
+        self._lookahead = lookahead
+
+    def __len__(self):
+        while list.__len__(self) < self._lookahead and self._source is not None:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+        return list.__len__(self)
+
+def _result_chunks(results, rows_per_block):
+    """Yield DataFrame blocks from a DataFrame or an iterable of DataFrame chunks"""
+    if isinstance(results, pd.DataFrame):
+        results = [results]
+    for chunk in results:
+        # Accept the short report keys as well as the predictor keys
+        chunk = chunk.rename(columns=canonical_key)
+        for start in range(0, len(chunk), rows_per_block):
+            yield chunk.iloc[start:start + rows_per_block]
+
+def _multi_mix_story(results, project_info, rows_per_block, styles):
+    """Generate the multi-mix report flowables block by block"""
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=colors.darkblue,
+        alignment=1  # Center alignment
+    )
+    header_style = ParagraphStyle(
+        'CustomHeader',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=colors.darkblue
+    )
+    block_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 7),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.aliceblue]),
+        ('GRID', (0, 0), (-1, -1), 0.25, colors.grey)
+    ])
+
+    yield Paragraph("AIcrete UHPC Multi-Mix Report", title_style)
+    yield Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal'])
+    if project_info:
+        yield Paragraph(f"<b>Project:</b> {project_info.get('name', 'N/A')}", styles['Normal'])
+        yield Paragraph(f"<b>Engineer:</b> {project_info.get('engineer', 'N/A')}", styles['Normal'])
+    yield Spacer(1, 20)
+    yield Paragraph("Mix Results", header_style)
+
+    # Running min / max / sum so the summary needs no second pass over the data
+    count = 0
+    totals, minimums, maximums = {}, {}, {}
+    columns = None
+
+    for block in _result_chunks(results, rows_per_block):
+        if columns is None:
+            columns = [c for c in MULTI_MIX_COLUMNS if c[0] in block.columns]
+        rows = [['Mix'] + [header for _, header, _ in columns]]
+        for label, values in zip(block.index, block[[key for key, _, _ in columns]].to_numpy(dtype=float)):
+            rows.append([str(label)] + [fmt.format(v) if np.isfinite(v) else '-'
+                                        for (_, _, fmt), v in zip(columns, values)])
+        table = Table(rows, repeatRows=1)
+        table.setStyle(block_style)
+        yield table
+
+        for key in MULTI_MIX_SUMMARY:
+            if key in block.columns:
+                values = block[key].to_numpy(dtype=float)
+                totals[key] = totals.get(key, 0.0) + np.nansum(values)
+                minimums[key] = min(minimums.get(key, np.inf), np.nanmin(values))
+                maximums[key] = max(maximums.get(key, -np.inf), np.nanmax(values))
+        count += len(block)
+
+    yield Spacer(1, 20)
+    yield Paragraph("Batch Summary", header_style)
+    yield Paragraph(f"<b>Mixes evaluated:</b> {count}", styles['Normal'])
+    if count and totals:
+        headers = dict((key, header.replace('\n', ' ')) for key, header, _ in MULTI_MIX_COLUMNS)
+        formats = dict((key, fmt) for key, _, fmt in MULTI_MIX_COLUMNS)
+        summary = [['Property', 'Min', 'Mean', 'Max']]
+        for key in MULTI_MIX_SUMMARY:
+            if key in totals:
+                fmt = formats[key]
+                summary.append([headers[key], fmt.format(minimums[key]),
+                                fmt.format(totals[key] / count), fmt.format(maximums[key])])
+        summary_table = Table(summary)
+        summary_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]))
+        yield Spacer(1, 10)
+        yield summary_table
+    yield Spacer(1, 20)
+    yield Paragraph("Generated by AIcrete Professional - Advanced Concrete Engineering Platform",
+                    styles['Normal'])
+
+def generate_multi_mix_report(results, project_info=None, rows_per_block=45, page_chunk=25, output=None):
+    """Stream a comparative PDF for many mixes with bounded memory.
+
+    results is a batch DataFrame (mix columns plus predict_properties_batch
+    columns) or an iterable of such DataFrames, e.g. chunks from read_csv.
+    Rows are tabled in paginated blocks that are generated only as layout
+    reaches them, finished pages are flushed to a temporary file every
+    page_chunk pages, and the PDF is written to output (default: a spooled
+    temporary file). Returns output positioned at the start of the PDF.
+    """
+    if output is None:
+        output = tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024)
+
+    doc = SimpleDocTemplate(output, pagesize=A4, topMargin=0.5*inch, pageCompression=1)
+    story = _LazyStory(_multi_mix_story(results, project_info, rows_per_block, getSampleStyleSheet()))
+    doc.build(story, canvasmaker=partial(_SpoolingCanvas, page_chunk=page_chunk))
+    output.seek(0)
+    return output
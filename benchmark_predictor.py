@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the AIcretePredictor hot paths
+
+Times each case at several batch sizes, appends the results to a history file
+and exits non-zero when a case is slower than the previous run on the same
+machine by more than the regression threshold.
+
+    python benchmark_predictor.py                  # run, compare, save
+    python benchmark_predictor.py -k uncertainty   # only matching cases
+    python benchmark_predictor.py --threshold 0.1 --no-save
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from aicrete_app import AIcretePredictor, MIX_COMPONENTS
+from aicrete_reports import generate_pdf_report, clear_chart_cache
+
+HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".benchmarks", "history.jsonl")
+DEFAULT_THRESHOLD = 0.25  # fail when more than 25% slower than the baseline
+
+def mix_library(predictor, n, seed=0):
+    """n reproducible mixes drawn uniformly from the feasible mix box"""
+    rng = np.random.default_rng(seed)
+    mixes = pd.DataFrame({c: rng.uniform(*predictor.mix_bounds[c], n) for c in MIX_COMPONENTS})
+    for key, value in predictor.curing_defaults.items():
+        mixes[key] = value
+    return mixes
+
+def benchmark_cases(predictor, quick=False):
+    """(name, callable) pairs - setup work happens here, outside the timed callables"""
+    mixes = mix_library(predictor, 1000)
+    records = mixes.to_dict('records')
+    base_mix = records[0]
+    predictions = predictor.predict_properties_batch(mixes).to_dict('records')
+    cases = []
+
+    def per_mix(name, fn, sizes):
+        for n in sizes:
+            cases.append((f"{name}[n={n}]", lambda n=n: [fn(i) for i in range(n)]))
+
+    per_mix('predict_properties', lambda i: predictor.predict_properties(records[i]),
+            (1, 100) if quick else (1, 100, 1000))
+    for n in ((100, 10000) if quick else (100, 10000, 100000)):
+        batch = mix_library(predictor, n)
+        cases.append((f"predict_properties_batch[n={n}]", lambda batch=batch: predictor.predict_properties_batch(batch)))
+
+    for method in ('delta', 'unscented'):
+        cases.append((f"predict_with_uncertainty[{method}]",
+                      lambda method=method: predictor.predict_with_uncertainty(base_mix, method=method)))
+    for n in ((100,) if quick else (100, 1000, 10000)):
+        cases.append((f"predict_with_uncertainty[monte_carlo,n={n}]",
+                      lambda n=n: predictor.predict_with_uncertainty(base_mix, n_simulations=n)))
+
+    for n in ((100,) if quick else (100, 1000)):
+        cases.append((f"target_based_design[n_candidates={n}]",
+                      lambda n=n: predictor.target_based_design('compressive_strength', 150, n_candidates=n)))
+    surrogate = predictor.fit_surrogate(n_train=256, n_validation=64, seed=0)
+    cases.append(("target_based_design[surrogate]",
+                  lambda: predictor.target_based_design('compressive_strength', 150, surrogate=surrogate)))
+
+    for resolution in ((20,) if quick else (10, 20, 50)):
+        cases.append((f"generate_optimization_data[resolution={resolution}]",
+                      lambda r=resolution: predictor.generate_optimization_data(base_mix, resolution=r)))
+    for n in ((128,) if quick else (128, 1024, 8192)):
+        cases.append((f"generate_correlation_data[n={n}]",
+                      lambda n=n: predictor.generate_correlation_data(base_mix, n_samples=n, seed=0)))
+
+    per_mix('comprehensive_sustainability_analysis',
+            lambda i: predictor.comprehensive_sustainability_analysis(records[i], predictions[i]),
+            (1, 100) if quick else (1, 100, 1000))
+    per_mix('check_standards_compliance',
+            lambda i: predictor.check_standards_compliance(records[i], predictions[i]),
+            (1, 100) if quick else (1, 100, 1000))
+
+    if predictor.initialize_shap_explainer():
+        per_mix('get_shap_explanations', lambda i: predictor.get_shap_explanations(records[i]),
+                (1, 10) if quick else (1, 10, 100))
+        for n in ((1, 1000) if quick else (1, 100, 10000, 100000)):
+            X = mix_library(predictor, n)[list(predictor.shap_feature_names)].to_numpy()
+            cases.append((f"shap_model_predict[sklearn,n={n}]", lambda X=X: predictor.shap_model.predict(X)))
+            cases.append((f"shap_model_predict[flat,n={n}]", lambda X=X: predictor.shap_forest.predict(X)))
+
+    report_predictions = {'strength': 150.0, 'flexural': 7.0, 'elastic': 55.0}
+    for quality in (('preview',) if quick else ('preview', 'print', 'vector')):
+        def report(quality=quality):
+            # Cold render - the chart cache would otherwise turn repeats into lookups
+            clear_chart_cache()
+            return generate_pdf_report(report_predictions, base_mix, report_type="Technical Analysis Report",
+                                       chart_quality=quality)
+        cases.append((f"generate_pdf_report[{quality}]", report))
+    return cases
+
+def time_case(fn, min_time=0.5, repeats=5):
+    """Seconds per call: best and median of repeats, each looping until min_time/repeats has passed"""
+    fn()  # warm-up
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeats or number >= 1 << 16:
+            break
+        number *= max(2, min(10, int(min_time / repeats / max(elapsed, 1e-9))))
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number)
+    return {'min': min(times), 'median': statistics.median(times), 'number': number, 'repeats': repeats}
+
+def machine_id():
+    return f"{platform.node()}|{platform.machine()}|{platform.python_version()}|{os.cpu_count()}"
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def compare(results, baseline, threshold):
+    """Rows of (case, baseline, current, ratio, regressed) against a baseline run"""
+    rows = []
+    for name, result in results.items():
+        previous = baseline['results'].get(name) if baseline else None
+        if previous is None:
+            rows.append((name, None, result['min'], None, False))
+            continue
+        ratio = result['min'] / previous['min']
+        rows.append((name, previous['min'], result['min'], ratio, ratio > 1 + threshold))
+    return rows
+
+def format_time(seconds):
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the AIcretePredictor hot paths")
+    parser.add_argument('-k', '--filter', help="only run cases whose name contains this text")
+    parser.add_argument('--quick', action='store_true', help="smaller batch sizes only")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown that counts as a regression (default 0.25)")
+    parser.add_argument('--min-time', type=float, default=0.5, help="seconds of timing per case")
+    parser.add_argument('--history', default=HISTORY_FILE, help="JSON-lines history file")
+    parser.add_argument('--no-save', action='store_true', help="do not append this run to the history")
+    args = parser.parse_args(argv)
+
+    # Time the computations themselves, not lookups in a shared cache left by earlier runs
+    os.environ.setdefault("AICRETE_SHARED_CACHE", "off")
+    predictor = AIcretePredictor()
+    cases = [(name, fn) for name, fn in benchmark_cases(predictor, args.quick)
+             if not args.filter or args.filter in name]
+
+    results = {}
+    for name, fn in cases:
+        results[name] = time_case(fn, min_time=args.min_time)
+        print(f"⏱️  {name:<60} {format_time(results[name]['min']):>10}")
+
+    machine = machine_id()
+    history = load_history(args.history)
+    # A run that regressed never becomes the baseline, so slowdowns cannot ratchet in
+    baseline = next((run for run in reversed(history)
+                     if run['machine'] == machine and not run.get('regressions')), None)
+    rows = compare(results, baseline, args.threshold)
+
+    print()
+    if baseline:
+        print(f"📊 Compared with {baseline['commit'] or 'unknown commit'} ({baseline['timestamp']})")
+    else:
+        print("📊 No previous run on this machine - results become the baseline")
+    for name, previous, current, ratio, regressed in rows:
+        if ratio is not None:
+            marker = "❌" if regressed else ("🚀" if ratio < 1 - args.threshold else "  ")
+            print(f"{marker} {name:<60} {format_time(previous):>10} → {format_time(current):>10}  x{ratio:.2f}")
+
+    regressions = [row[0] for row in rows if row[4]]
+    if not args.no_save:
+        os.makedirs(os.path.dirname(args.history), exist_ok=True)
+        with open(args.history, 'a') as f:
+            f.write(json.dumps({
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'commit': git_commit(),
+                'machine': machine,
+                'threshold': args.threshold,
+                'regressions': regressions,
+                'results': results
+            }) + "\n")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("\n✅ No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Offline build of the inverse-design tables used by Target-Based Design
+"""
+
+import time
+
+from aicrete_app import AIcretePredictor, INVERSE_DESIGN_TABLE
+
+def build_tables(n_candidates=65536):
+    """Score the candidate library and write the tables to design_tables/"""
+    start = time.time()
+    table = AIcretePredictor().build_inverse_design_tables(n_candidates=n_candidates)
+    print(f"✅ Built {len(table):,} inverse-design entries from {n_candidates:,} candidates "
+          f"in {time.time() - start:.1f}s")
+    print(f"📁 Saved to {INVERSE_DESIGN_TABLE}")
+
+if __name__ == "__main__":
+    build_tables()
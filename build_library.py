@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Offline build of an out-of-core candidate-mix library
+
+Generates candidate mixes chunk by chunk into memory-mapped float32 column files
+and scores them with AIcretePredictor, so libraries far larger than RAM can be
+built and then queried from the app or a notebook with CandidateLibrary.
+An interrupted build is finished with --resume, which scores the remaining rows.
+
+    python build_library.py --candidates 100000000 --out libraries/sobol_1e8
+    python build_library.py --grid-points 16 --out libraries/grid_16
+    python build_library.py --resume --out libraries/sobol_1e8
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from aicrete_app import AIcretePredictor, MIX_COMPONENTS
+from mix_library import CandidateLibrary
+from mix_screener import DEFAULT_BATCH_SIZE
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a memory-mapped candidate-mix library")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--grid-points', type=int, help="grid points per constituent across mix_bounds")
+    source.add_argument('--candidates', type=int, default=1_000_000, help="Sobol or random candidates")
+    source.add_argument('--resume', action='store_true', help="score the rows an interrupted build left")
+    parser.add_argument('--method', choices=['random', 'sobol'], default='sobol')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--overwrite', action='store_true')
+    parser.add_argument('--out', required=True, help="library directory")
+    args = parser.parse_args(argv)
+
+    predictor = AIcretePredictor()
+    start = time.time()
+    last_report = [start]
+    def progress(done, total):
+        if time.time() - last_report[0] >= 10:
+            last_report[0] = time.time()
+            print(f"   {done / total:6.1%}  {done:,} / {total:,} rows", flush=True)
+
+    if args.resume:
+        library = CandidateLibrary(args.out, mode='r+').score(predictor, args.chunk_size, progress=progress)
+    else:
+        grid = None
+        if args.grid_points:
+            grid = {c: np.linspace(*predictor.mix_bounds[c], args.grid_points) for c in MIX_COMPONENTS}
+        library = predictor.build_candidate_library(
+            args.out, grid=grid, n_candidates=args.candidates, method=args.method, seed=args.seed,
+            chunk_size=args.chunk_size, overwrite=args.overwrite, progress=progress
+        )
+
+    info = library.info()
+    print(f"✅ Library of {info['rows']:,} mixes ({info['size_gb']:.2f} GB) in {time.time() - start:.1f}s")
+    print(f"📁 Saved to {args.out}")
+    return 0 if library.complete else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
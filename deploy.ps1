@@ -31,6 +31,15 @@ Write-Host "🐍 Python version: $pythonVersion" -ForegroundColor Cyan
 Write-Host "📋 Installing dependencies..." -ForegroundColor Yellow
 pip install -r requirements.txt
 
+# Precompute inverse-design tables for instant target-based design
+Write-Host "📚 Building design tables..." -ForegroundColor Yellow
+python build_design_tables.py
+
+# Build on-disk artifacts and check every warm-up stage before traffic arrives
+Write-Host "🔥 Warming up..." -ForegroundColor Yellow
+python warmup.py
+if ($LASTEXITCODE -ne 0) { exit 1 }
+
 # Test the application locally
 Write-Host "🧪 Testing application..." -ForegroundColor Yellow
 $streamlitJob = Start-Job -ScriptBlock {
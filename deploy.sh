@@ -31,6 +31,14 @@ echo "🐍 Python version: $python_version"
 echo "📋 Installing dependencies..."
 pip install -r requirements.txt
 
+# Precompute inverse-design tables for instant target-based design
+echo "📚 Building design tables..."
+python build_design_tables.py
+
+# Build on-disk artifacts and check every warm-up stage before traffic arrives
+echo "🔥 Warming up..."
+python warmup.py || exit 1
+
 # Test the application locally
 echo "🧪 Testing application..."
 timeout 10s streamlit run aicrete_app.py --server.headless=true --server.port=8502 &
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Multi-session load test for the AIcrete Streamlit app
+
+Drives aicrete_app.py headlessly with Streamlit's AppTest: each simulated
+session replays a click script (predict, charts, SHAP, template comparison,
+PDF report) in its own thread, sharing one process and its caches the way a
+real server does. For every session count it reports p50/p95/p99 rerun
+latency, reruns per second and resident memory.
+
+AppTest swaps process-global runtime state on every run, so reruns from
+different sessions take turns on a lock. A Streamlit server's script threads
+mostly take turns on the GIL anyway, so queueing still shows up in the
+latencies, which are measured from click to finished rerun. AppTest also
+recompiles the script on every run (~0.1 s), which a server does only once.
+
+    python loadtest_app.py                        # 1, 2, 4 and 8 sessions
+    python loadtest_app.py --sessions 1 16 --iterations 3 --think 2
+    python loadtest_app.py --script predict shap --json results.json
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+_run_lock = threading.Lock()
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "aicrete_app.py")
+DEFAULT_SCRIPT = ['predict', 'charts', 'shap', 'templates', 'report']
+
+def click(key=None, label=None):
+    """Action pressing a button found by widget key or label"""
+    def action(at, rng):
+        if key is not None:
+            at.button(key=key).click()
+        else:
+            next(b for b in at.button if b.label == label).click()
+    return action
+
+def predict(at, rng):
+    """Edit the mix like an engineer would, then submit the prediction form"""
+    at.number_input[0].set_value(float(rng.choice(range(450, 700, 10))))
+    at.button(key="predict_tab1").click()
+
+STEPS = {
+    'predict': predict,
+    'charts': click(key="generate_charts_tab4"),
+    'shap': click(key="generate_shap"),
+    'templates': click(label="📊 Compare All Templates"),
+    'report': click(label="📄 Generate Report")
+}
+
+def rss_mb():
+    """Current resident set size of this process in MB"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # No procfs (macOS, Windows) - fall back to the peak (KB on Linux, bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+def run_session(session_id, script, iterations, think, timeout, samples, errors, seed):
+    """One simulated engineer: load the app, then replay the script iterations times"""
+    rng = random.Random(seed + session_id)
+    at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+
+    def rerun(step):
+        start = time.perf_counter()
+        with _run_lock:
+            at.run()
+        samples.append((step, time.perf_counter() - start))
+        if at.exception:
+            errors.append((session_id, step, at.exception[0].message))
+
+    try:
+        rerun('load')
+        for _ in range(iterations):
+            for step in script:
+                if think:
+                    time.sleep(rng.expovariate(1 / think))
+                STEPS[step](at, rng)
+                rerun(step)
+    except Exception as e:
+        errors.append((session_id, 'session', f"{type(e).__name__}: {e}"))
+
+def run_level(n_sessions, script, iterations, think, timeout, seed):
+    """Run n_sessions concurrently; latency percentiles, throughput and memory for the level"""
+    samples, errors = [], []
+    threads = [threading.Thread(target=run_session, name=f"session-{i}",
+                                args=(i, script, iterations, think, timeout, samples, errors, seed))
+               for i in range(n_sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    latencies = np.array([seconds for _, seconds in samples]) * 1000
+    per_step = {}
+    for step, seconds in samples:
+        per_step.setdefault(step, []).append(seconds * 1000)
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (np.nan,) * 3
+    return {
+        'sessions': n_sessions,
+        'reruns': len(samples),
+        'errors': len(errors),
+        'p50_ms': float(p50),
+        'p95_ms': float(p95),
+        'p99_ms': float(p99),
+        'throughput_rps': len(samples) / wall,
+        'wall_s': wall,
+        'rss_mb': rss_mb(),
+        'steps_p50_ms': {step: float(np.median(values)) for step, values in per_step.items()},
+        'error_samples': errors[:5]
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test aicrete_app.py with concurrent AppTest sessions")
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help="concurrent session counts to test (default 1 2 4 8)")
+    parser.add_argument('--script', nargs='+', choices=list(STEPS), default=DEFAULT_SCRIPT,
+                        help="click script each session replays")
+    parser.add_argument('--iterations', type=int, default=1, help="times each session replays the script")
+    parser.add_argument('--think', type=float, default=0.0,
+                        help="mean think time between clicks in seconds (exponential, default 0)")
+    parser.add_argument('--timeout', type=float, default=300, help="seconds allowed per rerun")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("AICRETE_WARMUP", "0")  # measure the app, not the boot warm-up thread
+    # One untimed load first, so module imports and process-wide caches are not charged to sessions
+    AppTest.from_file(APP_FILE, default_timeout=args.timeout).run()
+    baseline_rss = rss_mb()
+    print(f"🧪 Script: {' → '.join(['load'] + args.script)} x{args.iterations}, think {args.think:g}s")
+    print(f"{'Sessions':>8} {'Reruns':>7} {'Errors':>6} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} "
+          f"{'Reruns/s':>9} {'RSS (MB)':>9} {'MB/session':>10}")
+
+    results = []
+    for n_sessions in args.sessions:
+        level = run_level(n_sessions, args.script, args.iterations, args.think, args.timeout, args.seed)
+        level['rss_per_session_mb'] = (level['rss_mb'] - baseline_rss) / n_sessions
+        results.append(level)
+        print(f"{n_sessions:>8} {level['reruns']:>7} {level['errors']:>6} {level['p50_ms']:>9.0f} "
+              f"{level['p95_ms']:>9.0f} {level['p99_ms']:>9.0f} {level['throughput_rps']:>9.2f} "
+              f"{level['rss_mb']:>9.0f} {level['rss_per_session_mb']:>10.1f}")
+        for session_id, step, message in level['error_samples']:
+            print(f"   ❌ session {session_id} {step}: {message}")
+
+    print("\n⏱️  Median latency per step (ms)")
+    steps = ['load'] + list(dict.fromkeys(args.script))
+    print(f"{'Sessions':>8} " + " ".join(f"{step:>10}" for step in steps))
+    for level in results:
+        print(f"{level['sessions']:>8} " + " ".join(f"{level['steps_p50_ms'].get(step, float('nan')):>10.0f}"
+                                                    for step in steps))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'script': args.script, 'iterations': args.iterations, 'think': args.think,
+                       'baseline_rss_mb': baseline_rss, 'levels': results}, f, indent=2)
+    return 1 if any(level['errors'] for level in results) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""
+Mix Design Module for AIcrete UHPC Project
+Copyright 2025 Shiksha Seechurn / AIcrete
+
+This module provides the canonical mix representation used across the app:
+MixDesign for a single mix and MixBatch for many mixes held as one
+contiguous float64 array. Key aliases ('silica', 'sp', 'fibers', ...) are
+normalized once on construction, and derived ratios are computed lazily
+and cached, so hot paths no longer copy dicts or remap keys per call.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Raw (non-derived) inputs in AIcretePredictor.feature_names order
+MIX_FEATURES = ['cement', 'silica_fume', 'water', 'superplasticizer', 'coarse_aggregate',
+                'fine_aggregate', 'steel_fibers', 'age', 'curing_temperature', 'curing_humidity',
+                'compressive_strength']
+FEATURE_INDEX = {name: i for i, name in enumerate(MIX_FEATURES)}
+
+# Short and legacy keys used by the UI forms and report layouts
+KEY_ALIASES = {
+    'silica': 'silica_fume',
+    'sp': 'superplasticizer',
+    'coarse': 'coarse_aggregate',
+    'fine': 'fine_aggregate',
+    'fibers': 'steel_fibers',
+    'curing_temp': 'curing_temperature'
+}
+
+# Canonical keys -> the short keys generate_pdf_report lays out
+REPORT_KEYS = {
+    'cement': 'cement',
+    'silica_fume': 'silica',
+    'water': 'water',
+    'superplasticizer': 'sp',
+    'coarse_aggregate': 'coarse',
+    'fine_aggregate': 'fine',
+    'steel_fibers': 'fibers',
+    'age': 'age',
+    'curing_temperature': 'curing_temperature',
+    'curing_humidity': 'curing_humidity'
+}
+
+# Engineered features in AIcretePredictor.feature_names order
+DERIVED_FEATURES = ['w_c_ratio', 'sf_c_ratio', 'sp_c_ratio', 'fiber_volume_fraction',
+                    'aggregate_cement_ratio', 'total_binder']
+DERIVED_INDEX = {name: i for i, name in enumerate(DERIVED_FEATURES)}
+
+STEEL_DENSITY = 7850.0  # kg/m³, for fiber volume fraction
+
+
+def canonical_key(key):
+    """Canonical feature name for a possibly aliased key"""
+    return KEY_ALIASES.get(key, key)
+
+
+def derive_features(values):
+    """All engineered features for an (n, len(MIX_FEATURES)) array in one vectorized pass.
+
+    Unspecified (NaN) constituents count as zero; ratios use max(cement, 1).
+    Returns an (n, len(DERIVED_FEATURES)) array.
+    """
+    raw = np.nan_to_num(np.atleast_2d(np.asarray(values, dtype=np.float64)))
+    cement, silica_fume, water, superplasticizer, coarse, fine, fibers = raw[:, :7].T
+    per_cement = 1.0 / np.maximum(cement, 1)
+
+    derived = np.empty((len(raw), len(DERIVED_FEATURES)))
+    derived[:, 0] = water * per_cement
+    derived[:, 1] = silica_fume * per_cement
+    derived[:, 2] = superplasticizer * per_cement
+    derived[:, 3] = fibers / STEEL_DENSITY * 100  # % by volume
+    derived[:, 4] = (coarse + fine) * per_cement
+    derived[:, 5] = cement + silica_fume
+    return derived
+
+
+def _derived_property(name):
+    return property(lambda self: self.derived(name), doc=f"Derived {name} (cached)")
+
+
+class MixDesign:
+    """
+    Single mix with one slot per raw feature; unspecified features are NaN
+    """
+
+    __slots__ = tuple(MIX_FEATURES) + ('_derived',)
+
+    def __init__(self, **values):
+        for name in MIX_FEATURES:
+            object.__setattr__(self, name, np.nan)
+        for key, value in values.items():
+            name = canonical_key(key)
+            if name in FEATURE_INDEX and value is not None:
+                object.__setattr__(self, name, float(value))
+        object.__setattr__(self, '_derived', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MixDesign is immutable - use replace()")
+
+    @classmethod
+    def coerce(cls, mix):
+        """MixDesign from a MixDesign (returned as-is), dict or Series with any key aliases"""
+        if isinstance(mix, cls):
+            return mix
+        return cls(**dict(mix))
+
+    def replace(self, **values):
+        """Copy with some features changed"""
+        return MixDesign(**{**self.to_dict(), **values})
+
+    def get(self, key, default=None):
+        """Dict-style access: canonical, aliased or derived key; default when unspecified"""
+        name = canonical_key(key)
+        if name in FEATURE_INDEX:
+            value = getattr(self, name)
+        elif name in DERIVED_FEATURES:
+            value = self.derived(name)
+        else:
+            return default
+        return default if np.isnan(value) else value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def derived(self, name):
+        """Derived feature - all of them are computed together on first access and cached"""
+        if self._derived is None:
+            object.__setattr__(self, '_derived', derive_features(self.to_array())[0])
+        return float(self._derived[DERIVED_INDEX[name]])
+
+    w_c_ratio = _derived_property('w_c_ratio')
+    sf_c_ratio = _derived_property('sf_c_ratio')
+    sp_c_ratio = _derived_property('sp_c_ratio')
+    fiber_volume_fraction = _derived_property('fiber_volume_fraction')
+    aggregate_cement_ratio = _derived_property('aggregate_cement_ratio')
+    total_binder = _derived_property('total_binder')
+
+    def to_array(self):
+        return np.array([getattr(self, name) for name in MIX_FEATURES])
+
+    def to_dict(self):
+        """Specified raw features under canonical keys"""
+        return {name: getattr(self, name) for name in MIX_FEATURES if not np.isnan(getattr(self, name))}
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def items(self):
+        return self.to_dict().items()
+
+    def report_dict(self):
+        """Specified features under the short keys the report layouts use"""
+        return {REPORT_KEYS[k]: v for k, v in self.to_dict().items() if k in REPORT_KEYS}
+
+    def __repr__(self):
+        return f"MixDesign({', '.join(f'{k}={v:g}' for k, v in self.to_dict().items())})"
+
+
+class MixBatch:
+    """
+    Many mixes as one C-contiguous (n, len(MIX_FEATURES)) float64 array
+    """
+
+    __slots__ = ('values', 'index', '_derived')
+
+    def __init__(self, values, index=None):
+        self.values = np.ascontiguousarray(values, dtype=np.float64).reshape(-1, len(MIX_FEATURES))
+        self.index = pd.RangeIndex(len(self.values)) if index is None else index
+        self._derived = None
+
+    @classmethod
+    def from_frame(cls, frame):
+        """Batch from a DataFrame with canonical or aliased column names"""
+        values = np.full((len(frame), len(MIX_FEATURES)), np.nan)
+        for column in frame.columns:
+            name = canonical_key(column)
+            if name in FEATURE_INDEX:
+                values[:, FEATURE_INDEX[name]] = pd.to_numeric(frame[column], errors='coerce').to_numpy(dtype=float)
+        return cls(values, index=frame.index)
+
+    @classmethod
+    def from_records(cls, mixes):
+        """Batch from an iterable of MixDesigns and/or dicts"""
+        return cls(np.array([MixDesign.coerce(mix).to_array() for mix in mixes]).reshape(-1, len(MIX_FEATURES)))
+
+    @classmethod
+    def coerce(cls, mixes):
+        if isinstance(mixes, cls):
+            return mixes
+        if isinstance(mixes, pd.DataFrame):
+            return cls.from_frame(mixes)
+        return cls.from_records(mixes)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i):
+        return MixDesign(**dict(zip(MIX_FEATURES, self.values[i])))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def column(self, key):
+        """Read-only view of one feature column (NaN where unspecified)"""
+        view = self.values[:, FEATURE_INDEX[canonical_key(key)]]
+        view.flags.writeable = False
+        return view
+
+    def get(self, key, default):
+        """Feature column with unspecified entries filled by default"""
+        name = canonical_key(key)
+        column = self.derived(name) if name in DERIVED_FEATURES else self.values[:, FEATURE_INDEX[name]]
+        return np.where(np.isnan(column), default, column)
+
+    def derived_values(self):
+        """(n, len(DERIVED_FEATURES)) engineered features, derived once for the whole batch"""
+        if self._derived is None:
+            self._derived = derive_features(self.values)
+        return self._derived
+
+    def derived(self, name):
+        return self.derived_values()[:, DERIVED_INDEX[name]]
+
+    w_c_ratio = _derived_property('w_c_ratio')
+    sf_c_ratio = _derived_property('sf_c_ratio')
+    sp_c_ratio = _derived_property('sp_c_ratio')
+    fiber_volume_fraction = _derived_property('fiber_volume_fraction')
+    aggregate_cement_ratio = _derived_property('aggregate_cement_ratio')
+    total_binder = _derived_property('total_binder')
+
+    def to_frame(self):
+        """DataFrame of the specified raw features under canonical keys"""
+        frame = pd.DataFrame(self.values, columns=MIX_FEATURES, index=self.index)
+        return frame.loc[:, frame.notna().any()]
@@ -0,0 +1,94 @@
+"""
+Mix Index Module for AIcrete UHPC Project
+Copyright 2025 Shiksha Seechurn / AIcrete
+
+This module provides a precomputed nearest-neighbour index over known mixes
+(application templates, saved projects and a pre-scored candidate library)
+so design questions such as "closest known mix with CS >= X and cost <= Y"
+are answered by lookup instead of by re-running an optimizer.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+
+MIX_COMPONENTS = ['cement', 'silica_fume', 'water', 'superplasticizer',
+                  'coarse_aggregate', 'fine_aggregate', 'steel_fibers']
+
+
+class MixIndex:
+    """
+    KD-tree over normalized mix vectors with predicted properties attached
+    """
+
+    def __init__(self, mixes, properties, labels, bounds):
+        # mixes: DataFrame of MIX_COMPONENTS, properties: DataFrame of predictions,
+        # labels: DataFrame with 'source' and 'name'; all row-aligned
+        self.mixes = mixes[MIX_COMPONENTS].reset_index(drop=True)
+        self.properties = properties.reset_index(drop=True)
+        self.labels = labels.reset_index(drop=True)
+        self.lower = np.array([bounds[c][0] for c in MIX_COMPONENTS], dtype=float)
+        self.scale = np.array([bounds[c][1] - bounds[c][0] for c in MIX_COMPONENTS], dtype=float)
+        self._columns = {prop: self.properties[prop].to_numpy(dtype=float) for prop in self.properties}
+        self._sources = self.labels['source'].to_numpy()
+        self.table = pd.concat([self.labels, self.mixes, self.properties], axis=1)
+        self.tree = cKDTree(self._normalize(self.mixes.to_numpy(dtype=float)))
+
+    def __len__(self):
+        return len(self.mixes)
+
+    def _normalize(self, vectors):
+        """Put every component on the unit scale of its feasible range"""
+        return (np.asarray(vectors, dtype=float) - self.lower) / self.scale
+
+    def _feasible(self, constraints):
+        """Boolean mask of indexed mixes meeting {property: (min, max)} constraints"""
+        mask = np.ones(len(self), dtype=bool)
+        for prop, (min_val, max_val) in (constraints or {}).items():
+            values = self._columns[prop]
+            if min_val is not None:
+                mask &= values >= min_val
+            if max_val is not None:
+                mask &= values <= max_val
+        return mask
+
+    def nearest(self, mix, constraints=None, k=1, sources=None):
+        """Row positions and normalized distances of the k closest mixes meeting constraints.
+
+        constraints maps property -> (min, max), either bound may be None.
+        sources optionally restricts results to e.g. ['template', 'project'].
+        """
+        point = self._normalize([float(mix.get(c, 0)) for c in MIX_COMPONENTS])
+        mask = self._feasible(constraints)
+        if sources is not None:
+            mask &= np.isin(self._sources, sources)
+        n_feasible = int(mask.sum())
+        if n_feasible == 0:
+            return np.array([], dtype=int), np.array([])
+        k = min(k, n_feasible)
+
+        if n_feasible < len(self) // 8:
+            # Few feasible mixes - brute force over just those is cheaper than tree search
+            candidates = np.nonzero(mask)[0]
+            distances = np.linalg.norm(self.tree.data[candidates] - point, axis=1)
+            order = np.argpartition(distances, k - 1)[:k] if k < len(distances) else np.arange(len(distances))
+            order = order[np.argsort(distances[order])]
+            return candidates[order], distances[order]
+
+        # Grow the neighbourhood until k feasible mixes are inside it
+        search = max(4 * k, 16)
+        while True:
+            distances, indices = self.tree.query(point, k=min(search, len(self)))
+            distances, indices = np.atleast_1d(distances), np.atleast_1d(indices)
+            hits = mask[indices]
+            if hits.sum() >= k or search >= len(self):
+                return indices[hits][:k], distances[hits][:k]
+            search *= 4
+
+    def query(self, mix, constraints=None, k=1, sources=None):
+        """Closest indexed mixes as a DataFrame: label, mix, properties and distance"""
+        indices, distances = self.nearest(mix, constraints, k, sources)
+        result = self.table.iloc[indices].reset_index(drop=True)
+        result['distance'] = distances
+        return result
@@ -0,0 +1,269 @@
+"""
+Mix Library Module for AIcrete UHPC Project
+Copyright 2025 Shiksha Seechurn / AIcrete
+
+This module stores pre-scored candidate-mix libraries far larger than memory.
+A library is a directory of memory-mapped float32 column files (.npy, one per
+mix input or predicted property) plus a small JSON manifest recording the row
+count, columns, constant inputs and how far scoring has got. Libraries are
+generated and scored chunk by chunk, so only one chunk is ever in memory, and
+reads slice the memory maps straight into NumPy arrays and pandas DataFrames
+without copying - the OS pages in just the rows a query or chart touches.
+At 4 bytes per value, 500 million mixes with ten columns fit in 20 GB on disk.
+"""
+
+import os
+import json
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from mix_design import MixBatch, MIX_FEATURES, FEATURE_INDEX, canonical_key
+from mix_screener import TopK, DEFAULT_BATCH_SIZE
+
+
+LIBRARY_FORMAT = 'aicrete-candidate-library'
+LIBRARY_VERSION = 1
+MANIFEST = 'manifest.json'
+DTYPE = np.float32
+
+
+class CandidateLibrary:
+    """
+    Out-of-core table of candidate mixes and their predicted properties
+
+    inputs: varied mix features stored per row; constants: mix features shared by
+    every row (e.g. curing defaults), kept in the manifest instead of a column.
+    """
+
+    def __init__(self, path, mode='r'):
+        # mode 'r' for readers, 'r+' to score or fill an existing library in place
+        self.path = path
+        self.mode = mode
+        with open(os.path.join(path, MANIFEST)) as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format') != LIBRARY_FORMAT:
+            raise ValueError(f"{path} is not a candidate library")
+        if self.manifest.get('version', 0) > LIBRARY_VERSION:
+            raise ValueError(f"{path} was written by a newer library format (v{self.manifest['version']})")
+        self._columns = {}
+
+    @classmethod
+    def create(cls, path, n_rows, inputs, properties=(), constants=None, bounds=None, overwrite=False):
+        """Allocate an empty library on disk (sparse files - no disk is written until rows are)"""
+        if os.path.exists(os.path.join(path, MANIFEST)) and not overwrite:
+            raise FileExistsError(f"Candidate library already exists at {path}")
+        os.makedirs(path, exist_ok=True)
+        inputs = [canonical_key(name) for name in inputs]
+        manifest = {
+            'format': LIBRARY_FORMAT,
+            'version': LIBRARY_VERSION,
+            'created': datetime.now().isoformat(),
+            'n_rows': int(n_rows),
+            'dtype': np.dtype(DTYPE).name,
+            'inputs': inputs,
+            'properties': list(properties),
+            'constants': {canonical_key(name): float(value) for name, value in (constants or {}).items()},
+            'bounds': {name: [float(low), float(high)] for name, (low, high) in (bounds or {}).items()},
+            'generated_rows': 0,
+            'scored_rows': 0
+        }
+        for name in inputs + list(properties):
+            np.lib.format.open_memmap(cls._file(path, name), mode='w+', dtype=DTYPE, shape=(int(n_rows),))
+        cls._write_manifest(path, manifest)
+        return cls(path, mode='r+')
+
+    @classmethod
+    def generate(cls, path, batches, n_rows, inputs, constants=None, bounds=None, overwrite=False,
+                 progress=None):
+        """New library filled from a stream of MixBatch chunks (see mix_screener.grid_batches)"""
+        library = cls.create(path, n_rows, inputs, constants=constants, bounds=bounds, overwrite=overwrite)
+        indices = [FEATURE_INDEX[name] for name in library.inputs]
+        start = 0
+        for batch in batches:
+            stop = min(start + len(batch), library.n_rows)
+            for name, index in zip(library.inputs, indices):
+                library._column(name)[start:stop] = batch.values[:stop - start, index]
+            start = stop
+            library._checkpoint(generated_rows=start)
+            if progress is not None:
+                progress(start, library.n_rows)
+            if start >= library.n_rows:
+                break
+        return library
+
+    @staticmethod
+    def _file(path, name):
+        return os.path.join(path, f"{name}.npy")
+
+    @staticmethod
+    def _write_manifest(path, manifest):
+        # Write-then-rename, so a reader never sees a half-written manifest
+        temp = os.path.join(path, MANIFEST + '.tmp')
+        with open(temp, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp, os.path.join(path, MANIFEST))
+
+    def _checkpoint(self, **progress):
+        """Flush written columns, then record progress in the manifest"""
+        for column in self._columns.values():
+            if self.mode != 'r':
+                column.flush()
+        self.manifest.update(progress)
+        self._write_manifest(self.path, self.manifest)
+
+    def _column(self, name):
+        column = self._columns.get(name)
+        if column is None:
+            column = self._columns[name] = np.load(self._file(self.path, name), mmap_mode=self.mode)
+        return column
+
+    @property
+    def n_rows(self):
+        return self.manifest['n_rows']
+
+    @property
+    def inputs(self):
+        return self.manifest['inputs']
+
+    @property
+    def properties(self):
+        return self.manifest['properties']
+
+    @property
+    def constants(self):
+        return self.manifest['constants']
+
+    @property
+    def columns(self):
+        return self.inputs + self.properties
+
+    @property
+    def complete(self):
+        """Every row generated and scored"""
+        return (self.manifest['generated_rows'] >= self.n_rows
+                and (not self.properties or self.manifest['scored_rows'] >= self.n_rows))
+
+    def __len__(self):
+        return self.n_rows
+
+    def nbytes(self):
+        """Size of the column files on disk"""
+        return len(self.columns) * self.n_rows * np.dtype(DTYPE).itemsize
+
+    def column(self, name, start=0, stop=None):
+        """Read-only memory-mapped view of one column (no copy)"""
+        view = self._column(name)[start:stop]
+        view.flags.writeable = False
+        return view
+
+    def frame(self, start=0, stop=None, columns=None):
+        """DataFrame over rows [start, stop) whose columns are views of the memory maps (no copy)"""
+        stop = self.n_rows if stop is None else min(stop, self.n_rows)
+        return pd.DataFrame({name: self.column(name, start, stop) for name in (columns or self.columns)},
+                            index=pd.RangeIndex(start, stop), copy=False)
+
+    def chunks(self, chunk_size=DEFAULT_BATCH_SIZE, columns=None, start=0, stop=None):
+        """Yield zero-copy DataFrame chunks over the library"""
+        stop = self.n_rows if stop is None else min(stop, self.n_rows)
+        for begin in range(start, stop, chunk_size):
+            yield self.frame(begin, min(begin + chunk_size, stop), columns)
+
+    def mix_batch(self, start, stop):
+        """Rows [start, stop) as a float64 MixBatch with the constant inputs filled in, ready to predict"""
+        stop = min(stop, self.n_rows)
+        values = np.full((stop - start, len(MIX_FEATURES)), np.nan)
+        for name in self.inputs:
+            values[:, FEATURE_INDEX[name]] = self._column(name)[start:stop]
+        for name, value in self.constants.items():
+            values[:, FEATURE_INDEX[name]] = value
+        return MixBatch(values, index=pd.RangeIndex(start, stop))
+
+    def score(self, predictor, chunk_size=DEFAULT_BATCH_SIZE, noise=False, restart=False, progress=None):
+        """Predict every row in chunks and store the properties; resumes where an earlier run stopped.
+
+        restart=True re-scores from the first row, e.g. after the property model changed.
+        """
+        if self.mode == 'r':
+            raise PermissionError("Open the library with mode='r+' to score it")
+        start = 0 if restart else self.manifest['scored_rows']
+        stop = self.manifest['generated_rows']
+        for begin in range(start, stop, chunk_size):
+            end = min(begin + chunk_size, stop)
+            predictions = predictor.predict_properties_batch(self.mix_batch(begin, end), noise=noise)
+            if not self.properties:
+                self._add_properties(list(predictions.columns))
+            for name in self.properties:
+                self._column(name)[begin:end] = predictions[name].to_numpy()
+            self._checkpoint(scored_rows=end)
+            if progress is not None:
+                progress(end, stop)
+        return self
+
+    def _add_properties(self, properties):
+        for name in properties:
+            np.lib.format.open_memmap(self._file(self.path, name), mode='w+', dtype=DTYPE, shape=(self.n_rows,))
+        self.manifest['properties'] = properties
+        self._write_manifest(self.path, self.manifest)
+
+    def _mask(self, frame, constraints):
+        mask = np.ones(len(frame), dtype=bool)
+        for name, (min_val, max_val) in constraints.items():
+            values = frame[name].to_numpy()
+            mask &= (values >= min_val) & (values <= max_val)
+        return mask
+
+    def query(self, constraints, chunk_size=DEFAULT_BATCH_SIZE, limit=None):
+        """Row numbers meeting every {column: (min, max)} constraint, scanned chunk by chunk"""
+        rows = []
+        found = 0
+        for chunk in self.chunks(chunk_size, columns=list(constraints)):
+            hits = chunk.index.to_numpy()[self._mask(chunk, constraints)]
+            rows.append(hits)
+            found += len(hits)
+            if limit is not None and found >= limit:
+                break
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        return rows if limit is None else rows[:limit]
+
+    def take(self, rows, columns=None):
+        """Copy of the given rows (a small selection - e.g. query hits) as a DataFrame"""
+        rows = np.asarray(rows, dtype=np.int64)
+        return pd.DataFrame({name: np.asarray(self._column(name)[rows]) for name in (columns or self.columns)},
+                            index=pd.Index(rows, name='candidate'))
+
+    def sample(self, n, columns=None, seed=None):
+        """n rows drawn at random without replacement, in row order - for charts of a huge library"""
+        rng = np.random.default_rng(seed)
+        n = min(n, self.n_rows)
+        rows = np.sort(rng.choice(self.n_rows, n, replace=False)) if n < self.n_rows else np.arange(n)
+        return self.take(rows, columns)
+
+    def top_k(self, objective, k=50, constraints=None, chunk_size=DEFAULT_BATCH_SIZE):
+        """Best k rows for ('min' | 'max', column) or ('target', column, value), best first"""
+        constraints = constraints or {}
+        goal, name = objective[0], objective[1]
+        top = TopK(k, 0)
+        for chunk in self.chunks(chunk_size, columns=list(dict.fromkeys([name, *constraints]))):
+            values = chunk[name].to_numpy(dtype=float)
+            scores = values if goal == 'min' else -values if goal == 'max' else np.abs(values - objective[2])
+            mask = self._mask(chunk, constraints)
+            top.push(scores[mask], chunk.index.to_numpy()[mask], np.empty((int(mask.sum()), 0)))
+        scores, rows, _ = top.sorted()
+        table = self.take(rows)
+        table['score'] = scores
+        return table
+
+    def info(self):
+        """Manifest summary for display"""
+        return {
+            'path': self.path,
+            'rows': self.n_rows,
+            'inputs': self.inputs,
+            'properties': self.properties,
+            'constants': self.constants,
+            'generated_rows': self.manifest['generated_rows'],
+            'scored_rows': self.manifest['scored_rows'],
+            'size_gb': self.nbytes() / 1024 ** 3
+        }
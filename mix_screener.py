@@ -0,0 +1,285 @@
+"""
+Mix Screener Module for AIcrete UHPC Project
+Copyright 2025 Shiksha Seechurn / AIcrete
+
+This module screens arbitrarily many candidate mixes - a Cartesian grid walked
+in index order, or an endless uniform-random or Sobol stream - through batched
+prediction, keeping only what a screen needs: the top-k mixes per objective and
+how many candidates passed each constraint. Memory is set by the batch size and
+k, not by the number of candidates, so 10^8 combinations can run overnight.
+Screening stops when the stream runs out, at a candidate or time budget, or
+early once no objective's top-k has improved for a number of batches.
+"""
+
+import math
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.stats import qmc
+
+from mix_design import MixBatch, MIX_FEATURES, FEATURE_INDEX, DERIVED_FEATURES, canonical_key
+
+
+DEFAULT_BATCH_SIZE = 65536
+OBJECTIVE_GOALS = ('min', 'max', 'target')
+
+
+def _column_indices(values):
+    """{canonical feature: value} -> {MIX_FEATURES index: value}"""
+    return {FEATURE_INDEX[canonical_key(name)]: value for name, value in (values or {}).items()}
+
+
+def grid_size(axes):
+    """Number of combinations in the Cartesian grid over axes {feature: values}"""
+    return math.prod(len(values) for values in axes.values())
+
+
+def grid_batches(axes, fixed=None, batch_size=DEFAULT_BATCH_SIZE, start=0):
+    """Cartesian grid over axes {feature: values} as MixBatch chunks, never materialized.
+
+    Candidates are numbered in row-major order of axes; each chunk's index holds the
+    candidate numbers, so any result maps back to its grid point. start resumes a grid.
+    """
+    axes = {index: np.asarray(values, dtype=float) for index, values in _column_indices(axes).items()}
+    fixed = _column_indices(fixed)
+    shape = tuple(len(values) for values in axes.values())
+    total = math.prod(shape)
+    for begin in range(start, total, batch_size):
+        end = min(begin + batch_size, total)
+        coordinates = np.unravel_index(np.arange(begin, end), shape)
+        block = np.full((end - begin, len(MIX_FEATURES)), np.nan)
+        for (index, values), coordinate in zip(axes.items(), coordinates):
+            block[:, index] = values[coordinate]
+        for index, value in fixed.items():
+            block[:, index] = value
+        yield MixBatch(block, index=pd.RangeIndex(begin, end))
+
+
+def random_batches(bounds, fixed=None, batch_size=DEFAULT_BATCH_SIZE, n_candidates=None, method='random',
+                   seed=None):
+    """Candidates spread over bounds {feature: (low, high)} as MixBatch chunks.
+
+    method: 'random' (uniform) or 'sobol' (scrambled, keep batch_size a power of two).
+    The stream is endless unless n_candidates is given.
+    """
+    columns = _column_indices(bounds)
+    lower = np.array([low for low, _ in columns.values()], dtype=float)
+    upper = np.array([high for _, high in columns.values()], dtype=float)
+    fixed = _column_indices(fixed)
+    if method == 'sobol':
+        try:
+            engine = qmc.Sobol(len(columns), rng=seed)
+        except TypeError:
+            # SciPy < 1.15
+            engine = qmc.Sobol(len(columns), seed=seed)
+        draw = lambda n: qmc.scale(engine.random(n), lower, upper)
+    elif method == 'random':
+        rng = np.random.default_rng(seed)
+        draw = lambda n: rng.uniform(lower, upper, (n, len(columns)))
+    else:
+        raise ValueError(f"Unknown sampling method: {method}")
+
+    begin = 0
+    while n_candidates is None or begin < n_candidates:
+        size = batch_size if n_candidates is None else min(batch_size, n_candidates - begin)
+        block = np.full((size, len(MIX_FEATURES)), np.nan)
+        block[:, list(columns)] = draw(size)
+        for index, value in fixed.items():
+            block[:, index] = value
+        yield MixBatch(block, index=pd.RangeIndex(begin, begin + size))
+        begin += size
+
+
+class TopK:
+    """
+    The k lowest scores seen so far and their rows, merged batch by batch with argpartition
+    """
+
+    def __init__(self, k, width):
+        self.k = k
+        self.scores = np.empty(0)
+        self.ids = np.empty(0, dtype=np.int64)
+        self.rows = np.empty((0, width))
+
+    @property
+    def threshold(self):
+        """Score a candidate must beat to get in (inf until k are held)"""
+        return self.scores.max() if len(self.scores) >= self.k else np.inf
+
+    def push(self, scores, ids, rows):
+        """Fold a batch of candidates in"""
+        keep = scores < self.threshold
+        if not keep.any():
+            return
+        scores, ids, rows = scores[keep], ids[keep], rows[keep]
+        if len(scores) > self.k:
+            best = np.argpartition(scores, self.k - 1)[:self.k]
+            scores, ids, rows = scores[best], ids[best], rows[best]
+        scores = np.concatenate([self.scores, scores])
+        ids = np.concatenate([self.ids, ids])
+        rows = np.concatenate([self.rows, rows])
+        if len(scores) > self.k:
+            best = np.argpartition(scores, self.k - 1)[:self.k]
+            scores, ids, rows = scores[best], ids[best], rows[best]
+        self.scores, self.ids, self.rows = scores, ids, rows
+
+    def sorted(self):
+        """(scores, ids, rows) best first"""
+        order = np.lexsort((self.ids, self.scores))
+        return self.scores[order], self.ids[order], self.rows[order]
+
+
+class MixScreener:
+    """
+    Streaming top-k screen of candidate mixes against objectives and constraints
+
+    objectives: {name: spec} with spec ('min', property), ('max', property),
+    ('target', property, value) or a callable (batch, predictions) -> scores,
+    lower is better. constraints: {name: (min, max)} on predicted properties or
+    mix features, derived ratios included. Candidates failing any constraint are
+    counted but never ranked.
+    """
+
+    def __init__(self, predictor, objectives, constraints=None, k=50, noise=False, patience=None, tolerance=0.0):
+        for name, spec in objectives.items():
+            if not callable(spec) and spec[0] not in OBJECTIVE_GOALS:
+                raise ValueError(f"Objective '{name}': goal must be one of {OBJECTIVE_GOALS}")
+        self.predictor = predictor
+        self.objectives = dict(objectives)
+        self.constraints = dict(constraints or {})
+        self.k = k
+        # Rank on the mean response - with the model residual on, screening would favour lucky draws
+        self.noise = noise
+        self.patience = patience
+        self.tolerance = tolerance
+        self.reset()
+
+    def reset(self):
+        self.properties = None
+        self.top = {}
+        self.screened = 0
+        self.feasible = 0
+        self.batches = 0
+        self.seconds = 0.0
+        self.constraint_passes = dict.fromkeys(self.constraints, 0)
+        self._reference = {}
+        self._stalled = 0
+
+    def _constraint_values(self, name, batch, predictions):
+        if name in predictions:
+            return predictions[name].to_numpy(dtype=float)
+        name = canonical_key(name)
+        if name in DERIVED_FEATURES:
+            return batch.derived(name)
+        return batch.values[:, FEATURE_INDEX[name]]
+
+    def _scores(self, spec, batch, predictions):
+        if callable(spec):
+            return np.asarray(spec(batch, predictions), dtype=float)
+        values = predictions[spec[1]].to_numpy(dtype=float)
+        if spec[0] == 'min':
+            return values
+        if spec[0] == 'max':
+            return -values
+        return np.abs(values - spec[2])
+
+    def update(self, batch, rng=None):
+        """Screen one batch of candidates; returns True if any objective's top-k improved"""
+        batch = MixBatch.coerce(batch)
+        start = time.perf_counter()
+        predictions = self.predictor.predict_properties_batch(batch, rng=rng, noise=self.noise)
+        if self.properties is None:
+            self.properties = list(predictions.columns)
+        feasible = np.ones(len(batch), dtype=bool)
+        for name, (min_val, max_val) in self.constraints.items():
+            values = self._constraint_values(name, batch, predictions)
+            passed = (values >= min_val) & (values <= max_val)
+            self.constraint_passes[name] += int(np.count_nonzero(passed))
+            feasible &= passed
+
+        improved = False
+        if feasible.any():
+            ids = batch.index.to_numpy()[feasible]
+            rows = np.hstack([batch.values[feasible], predictions[self.properties].to_numpy(dtype=float)[feasible]])
+            for name, spec in self.objectives.items():
+                top = self.top.setdefault(name, TopK(self.k, rows.shape[1]))
+                scores = self._scores(spec, batch, predictions)[feasible]
+                top.push(np.where(np.isnan(scores), np.inf, scores), ids, rows)
+                # Improvement: the k-th best score fell by more than tolerance since the last one
+                threshold = top.threshold
+                if threshold < self._reference.get(name, np.inf) - self.tolerance or not np.isfinite(threshold):
+                    self._reference[name] = threshold
+                    improved = True
+
+        self._stalled = 0 if improved else self._stalled + 1
+        self.screened += len(batch)
+        self.feasible += int(np.count_nonzero(feasible))
+        self.batches += 1
+        self.seconds += time.perf_counter() - start
+        return improved
+
+    def screen(self, batches, max_candidates=None, max_seconds=None, progress=None, rng=None):
+        """Screen a stream of candidate batches (see grid_batches / random_batches).
+
+        Stops when the stream ends, after max_candidates or max_seconds, or when no
+        objective's top-k has improved for patience consecutive batches. progress, if
+        given, is called with the running summary after every batch.
+        """
+        deadline = None if max_seconds is None else time.monotonic() + max_seconds
+        stopped = 'exhausted'
+        for batch in batches:
+            if max_candidates is not None:
+                remaining = max_candidates - self.screened
+                if remaining <= 0:
+                    stopped = 'max_candidates'
+                    break
+                if len(batch) > remaining:
+                    batch = MixBatch(batch.values[:remaining], index=batch.index[:remaining])
+            self.update(batch, rng=rng)
+            if progress is not None:
+                progress(self.summary())
+            if self.patience is not None and self._stalled >= self.patience:
+                stopped = 'converged'
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                stopped = 'time_budget'
+                break
+        else:
+            if max_candidates is not None and self.screened >= max_candidates:
+                stopped = 'max_candidates'
+        return self.result(stopped)
+
+    def summary(self):
+        """Counts, rate and the current k-th best score per objective"""
+        return {
+            'screened': self.screened,
+            'feasible': self.feasible,
+            'batches': self.batches,
+            'seconds': self.seconds,
+            'rate': self.screened / self.seconds if self.seconds else 0.0,
+            'constraint_passes': dict(self.constraint_passes),
+            'thresholds': {name: float(top.threshold) for name, top in self.top.items()}
+        }
+
+    def top_k(self, name):
+        """Best mixes for one objective, best first: candidate number, mix, predictions and score"""
+        columns = MIX_FEATURES + (self.properties or [])
+        top = self.top.get(name)
+        if top is None:
+            return pd.DataFrame(columns=['candidate'] + columns + ['score'])
+        scores, ids, rows = top.sorted()
+        table = pd.DataFrame(rows, columns=columns)
+        # compressive_strength is both a model input and a property; keep the predicted column
+        table = table.loc[:, ~table.columns.duplicated(keep='last')]
+        table = table.loc[:, table.notna().any()]
+        table.insert(0, 'candidate', ids)
+        table['score'] = scores
+        return table
+
+    def result(self, stopped=None):
+        """Summary plus {objective: top-k DataFrame} and why screening stopped"""
+        result = self.summary()
+        result['stopped'] = stopped
+        result['top'] = {name: self.top_k(name) for name in self.objectives}
+        return result
@@ -0,0 +1,173 @@
+"""
+Rerun Profiler Module for AIcrete UHPC Project
+Copyright 2025 Shiksha Seechurn / AIcrete
+
+This module provides opt-in instrumentation for Streamlit reruns: spans around
+tab bodies and AIcretePredictor methods record wall time, call counts and
+(optionally) traced allocations. Results are summarized per span and exported
+as Chrome-trace JSON for chrome://tracing or Perfetto. When no profiler is
+active the instrumentation costs one context-variable lookup per call.
+"""
+
+import os
+import time
+import threading
+import inspect
+import functools
+import contextvars
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+import pandas as pd
+
+
+_active_profiler = contextvars.ContextVar('aicrete_rerun_profiler', default=None)
+
+# tracemalloc is process-wide - count the reruns that need it so one session
+# finishing does not stop tracing under another
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+
+
+class RerunProfiler:
+    """
+    Collects timed spans for one script rerun
+    """
+
+    def __init__(self, track_allocations=False):
+        self.track_allocations = track_allocations
+        self.events = []
+        self.origin = time.perf_counter()
+        self._stack = []  # child time accumulated by each open span
+
+    @contextmanager
+    def span(self, name, category='function'):
+        """Time a block; nested spans are attributed to their parent for self time"""
+        tracing = self.track_allocations and tracemalloc.is_tracing()
+        memory_before = tracemalloc.get_traced_memory()[0] if tracing else None
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            child_time = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += duration
+            event = {
+                'name': name,
+                'category': category,
+                'start': start - self.origin,
+                'duration': duration,
+                'self': duration - child_time,
+                'depth': len(self._stack),
+                'thread': threading.get_ident()
+            }
+            if tracing:
+                event['alloc_bytes'] = tracemalloc.get_traced_memory()[0] - memory_before
+            self.events.append(event)
+
+    @property
+    def total_seconds(self):
+        """Wall time of the outermost spans"""
+        return sum(e['duration'] for e in self.events if e['depth'] == 0)
+
+    def summary(self):
+        """Per-span totals, slowest first"""
+        columns = ['Span', 'Category', 'Calls', 'Total (ms)', 'Self (ms)', 'Mean (ms)', 'Max (ms)']
+        if not self.events:
+            return pd.DataFrame(columns=columns)
+        events = pd.DataFrame(self.events)
+        grouped = events.groupby(['name', 'category'], sort=False)
+        summary = pd.DataFrame({
+            'Calls': grouped.size(),
+            'Total (ms)': grouped['duration'].sum() * 1000,
+            'Self (ms)': grouped['self'].sum() * 1000,
+            'Mean (ms)': grouped['duration'].mean() * 1000,
+            'Max (ms)': grouped['duration'].max() * 1000
+        })
+        if 'alloc_bytes' in events:
+            summary['Net alloc (KB)'] = grouped['alloc_bytes'].sum() / 1024
+        summary = summary.reset_index().rename(columns={'name': 'Span', 'category': 'Category'})
+        return summary.sort_values('Total (ms)', ascending=False).reset_index(drop=True)
+
+    def chrome_trace(self):
+        """Trace Event Format dict (complete 'X' events) for chrome://tracing / Perfetto"""
+        pid = os.getpid()
+        trace_events = []
+        for event in sorted(self.events, key=lambda e: e['start']):
+            args = {'self_ms': round(event['self'] * 1000, 3)}
+            if 'alloc_bytes' in event:
+                args['alloc_bytes'] = event['alloc_bytes']
+            trace_events.append({
+                'name': event['name'],
+                'cat': event['category'],
+                'ph': 'X',
+                'ts': event['start'] * 1e6,
+                'dur': event['duration'] * 1e6,
+                'pid': pid,
+                'tid': event['thread'],
+                'args': args
+            })
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+
+@contextmanager
+def profile_rerun(profiler, name='rerun'):
+    """Make profiler the active one for this thread's rerun (no-op for None)"""
+    if profiler is None:
+        yield None
+        return
+
+    global _tracing_users
+    if profiler.track_allocations:
+        with _tracing_lock:
+            if _tracing_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+            _tracing_users += 1
+    token = _active_profiler.set(profiler)
+    try:
+        with profiler.span(name, 'rerun'):
+            yield profiler
+    finally:
+        _active_profiler.reset(token)
+        if profiler.track_allocations:
+            with _tracing_lock:
+                _tracing_users -= 1
+                if _tracing_users == 0:
+                    tracemalloc.stop()
+
+
+def profile_span(name, category='tab'):
+    """Span on the active profiler, or a null context when profiling is off"""
+    profiler = _active_profiler.get()
+    return nullcontext() if profiler is None else profiler.span(name, category)
+
+
+def profiled(func=None, *, name=None, category='function'):
+    """Decorator recording each call as a span while a profiler is active"""
+    if func is None:
+        return functools.partial(profiled, name=name, category=category)
+    label = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _active_profiler.get()
+        if profiler is None:
+            return func(*args, **kwargs)
+        with profiler.span(label, category):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def instrument_methods(cls):
+    """Class decorator applying @profiled to every public plain method of cls.
+
+    Generator methods are skipped - a span would only time creating the generator.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith('_') or not inspect.isfunction(value) or inspect.isgeneratorfunction(value):
+            continue
+        setattr(cls, attr, profiled(value, category=cls.__name__))
+    return cls
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Overnight screening of very large candidate-mix grids
+
+Streams a Cartesian grid over the seven constituents (or a random / Sobol
+stream over the feasible box) through batched prediction and writes the best
+k mixes per objective to CSV for the lab, with constraint pass counts in a JSON
+summary. Memory stays flat however many candidates are screened.
+
+    python screen_mixes.py --grid-points 14                      # 14^7 ≈ 10^8 grid
+    python screen_mixes.py --candidates 10000000 --method sobol --patience 20
+    python screen_mixes.py --objective min:cost target:tensile_strength=7 \\
+        --constraint cost=0:400 w_c_ratio=0.15:0.25 --k 50 --max-hours 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from aicrete_app import AIcretePredictor, MIX_COMPONENTS
+from mix_screener import grid_size, DEFAULT_BATCH_SIZE
+
+def parse_objective(text):
+    """'min:cost', 'max:UPV' or 'target:tensile_strength=7' -> (name, spec)"""
+    goal, _, prop = text.partition(':')
+    if goal == 'target':
+        prop, _, value = prop.partition('=')
+        return f"{prop}_{value}", ('target', prop, float(value))
+    return f"{goal}_{prop}", (goal, prop)
+
+def parse_constraint(text):
+    """'cost=0:400' -> ('cost', (0.0, 400.0)); either limit may be left empty"""
+    name, _, limits = text.partition('=')
+    low, _, high = limits.partition(':')
+    return name, (float(low) if low else -np.inf, float(high) if high else np.inf)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Screen a large candidate-mix space for the top-k mixes")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--grid-points', type=int, help="grid points per constituent across mix_bounds")
+    source.add_argument('--candidates', type=int, default=1_000_000,
+                        help="random candidates to screen (0 streams until --patience or --max-hours)")
+    parser.add_argument('--method', choices=['random', 'sobol'], default='random')
+    parser.add_argument('--objective', nargs='+', default=['min:cost'],
+                        help="min:PROPERTY, max:PROPERTY or target:PROPERTY=VALUE (default min:cost)")
+    parser.add_argument('--constraint', nargs='+', default=[], help="NAME=MIN:MAX on a property or mix ratio")
+    parser.add_argument('--k', type=int, default=50, help="mixes kept per objective (default 50)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--patience', type=int, help="stop after this many batches without improvement")
+    parser.add_argument('--tolerance', type=float, default=0.0, help="smallest k-th score change that counts")
+    parser.add_argument('--max-hours', type=float, help="time budget")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help="output directory (default screening/<timestamp>)")
+    args = parser.parse_args(argv)
+
+    predictor = AIcretePredictor()
+    objectives = dict(parse_objective(text) for text in args.objective)
+    constraints = dict(parse_constraint(text) for text in args.constraint)
+    grid = None
+    if args.grid_points:
+        grid = {c: np.linspace(*predictor.mix_bounds[c], args.grid_points) for c in MIX_COMPONENTS}
+        total = grid_size(grid)
+    else:
+        total = args.candidates or None
+    print(f"🔎 Screening {f'{total:,}' if total else 'an endless stream of'} candidates "
+          f"for {', '.join(objectives)}, keeping the top {args.k}")
+
+    last_report = [time.monotonic()]
+    def progress(summary):
+        if time.monotonic() - last_report[0] >= 10:
+            last_report[0] = time.monotonic()
+            done = f"{summary['screened'] / total:6.1%}" if total else f"{summary['screened']:,}"
+            print(f"   {done}  {summary['rate']:,.0f} mixes/s  feasible {summary['feasible']:,}", flush=True)
+
+    result = predictor.screen_mixes(
+        objectives, constraints, k=args.k, grid=grid, n_candidates=total, method=args.method,
+        batch_size=args.batch_size, patience=args.patience, tolerance=args.tolerance,
+        max_seconds=None if args.max_hours is None else args.max_hours * 3600, seed=args.seed,
+        progress=progress
+    )
+
+    out = args.out or os.path.join("screening", datetime.now().strftime("%Y%m%d_%H%M%S"))
+    os.makedirs(out, exist_ok=True)
+    for name, table in result['top'].items():
+        table.to_csv(os.path.join(out, f"top_{name}.csv"), index=False)
+    summary = {key: value for key, value in result.items() if key != 'top'}
+    summary.update(objectives={name: list(spec) for name, spec in objectives.items()},
+                   constraints={name: list(limits) for name, limits in constraints.items()})
+    with open(os.path.join(out, "summary.json"), 'w') as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"\n✅ Screened {result['screened']:,} candidates in {result['seconds']:.0f}s "
+          f"({result['rate']:,.0f}/s), {result['feasible']:,} feasible - stopped: {result['stopped']}")
+    for name, passed in result['constraint_passes'].items():
+        print(f"   {name}: {passed:,} passed ({passed / max(result['screened'], 1):.1%})")
+    print(f"📁 Top {args.k} per objective saved to {out}")
+    return 0 if result['feasible'] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
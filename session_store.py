@@ -0,0 +1,142 @@
+"""
+Session Store Module for AIcrete UHPC Project
+Copyright 2025 Shiksha Seechurn / AIcrete
+
+This module keeps large per-session artifacts (sweep DataFrames, response
+surfaces, correlation data, batch results) out of server memory. Values stored
+with stash() above the spill threshold are written to a compressed file on
+local disk, and only a small handle stays in st.session_state; recall() reloads
+them lazily. Finished files (report archives, PDFs) are written straight to
+the same directory and stashed as a SpilledFile handle, so they are never held
+in memory at all. Files are deleted when their handle is garbage collected,
+i.e. when the session ends or the key is overwritten.
+"""
+
+import os
+import sys
+import uuid
+import zlib
+import pickle
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+
+
+# Values larger than this (estimated in-memory bytes) are spilled to disk
+SPILL_THRESHOLD_BYTES = int(os.environ.get("AICRETE_SPILL_KB", "256")) * 1024
+SPILL_DIR = os.path.join(tempfile.gettempdir(), "aicrete_spill", str(os.getpid()))
+
+
+def estimate_nbytes(value):
+    """Approximate in-memory size of a session value"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(k) + estimate_nbytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class SpilledValue:
+    """
+    Handle to a value held as a compressed pickle on disk
+    """
+
+    __slots__ = ('path', 'nbytes', 'disk_bytes', 'type_name', '__weakref__')
+
+    def __init__(self, value, nbytes=None, directory=None):
+        directory = directory or SPILL_DIR
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{uuid.uuid4().hex}.pkl.z")
+        self.nbytes = estimate_nbytes(value) if nbytes is None else nbytes
+        self.type_name = type(value).__name__
+        payload = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        with open(self.path, 'wb') as f:
+            f.write(payload)
+        self.disk_bytes = len(payload)
+        weakref.finalize(self, _remove, self.path)
+
+    def load(self):
+        """Read the value back (a fresh copy on every call)"""
+        with open(self.path, 'rb') as f:
+            return pickle.loads(zlib.decompress(f.read()))
+
+    def __repr__(self):
+        return f"SpilledValue({self.type_name}, {self.nbytes / 1024:.0f} KB -> {self.disk_bytes / 1024:.0f} KB on disk)"
+
+
+class SpilledFile:
+    """
+    Handle to a finished file (e.g. a generated report) kept on local disk for a session
+    """
+
+    __slots__ = ('path', 'file_name', '__weakref__')
+
+    def __init__(self, file_name, directory=None):
+        directory = directory or SPILL_DIR
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{uuid.uuid4().hex}{os.path.splitext(file_name)[1]}")
+        self.file_name = file_name
+        weakref.finalize(self, _remove, self.path)
+
+    def open(self, mode='rb'):
+        """The file on disk - write it with mode='w+b', then stash the handle"""
+        return open(self.path, mode)
+
+    @property
+    def size(self):
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def __repr__(self):
+        return f"SpilledFile({self.file_name}, {self.size / 1024:.0f} KB on disk)"
+
+
+def stash(state, key, value, threshold=None):
+    """Store value under key in state, spilling it to disk when larger than threshold bytes"""
+    threshold = SPILL_THRESHOLD_BYTES if threshold is None else threshold
+    nbytes = estimate_nbytes(value)
+    state[key] = SpilledValue(value, nbytes) if nbytes > threshold else value
+    return value
+
+
+def recall(state, key, default=None):
+    """Value stored under key, reloading it from disk if it was spilled (SpilledFile handles are returned as is)"""
+    value = state.get(key, default)
+    return value.load() if isinstance(value, SpilledValue) else value
+
+
+def session_memory_report(state):
+    """Per-key memory of a session: estimated in-memory size and, for spilled keys, size on disk"""
+    rows = []
+    for key, value in state.items():
+        spilled = isinstance(value, SpilledValue)
+        on_disk = value.disk_bytes if spilled else value.size if isinstance(value, SpilledFile) else 0
+        rows.append({
+            'Key': str(key),
+            'Type': value.type_name if spilled else type(value).__name__,
+            'In memory (KB)': (sys.getsizeof(value) if spilled else estimate_nbytes(value)) / 1024,
+            'Spilled (KB)': value.nbytes / 1024 if spilled else 0.0,
+            'On disk (KB)': on_disk / 1024
+        })
+    columns = ['Key', 'Type', 'In memory (KB)', 'Spilled (KB)', 'On disk (KB)']
+    report = pd.DataFrame(rows, columns=columns)
+    return report.sort_values('In memory (KB)', ascending=False).reset_index(drop=True)
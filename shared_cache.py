@@ -0,0 +1,189 @@
+"""
+Shared Cache Module for AIcrete UHPC Project
+Copyright 2025 Shiksha Seechurn / AIcrete
+
+This module provides a result cache shared by every Streamlit worker process
+on a host: a SQLite database on local disk (WAL mode, so readers never block
+the writer). Keys are versioned - schema, namespace and namespace version plus
+a content hash of the inputs - so a change to a computation only needs its
+version bumped; stale entries are never read again and age out. The database is
+kept under a size budget by evicting least-recently-used entries, and entries
+older than the TTL are treated as misses.
+
+Cache failures never break the app: any SQLite error is a miss.
+"""
+
+import os
+import json
+import time
+import zlib
+import pickle
+import sqlite3
+import hashlib
+import threading
+
+
+CACHE_SCHEMA = 1  # bump when the key or value encoding changes
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "shared_cache.sqlite3")
+DEFAULT_MAX_MB = 256
+DEFAULT_TTL_DAYS = 7
+EVICT_EVERY = 64  # writes between size checks
+TOUCH_INTERVAL = 60.0  # seconds - coarse LRU so hot reads are not all writes
+
+
+class SharedCache:
+    """
+    Versioned key/value cache in a SQLite file shared across processes
+    """
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_MB * 1024 * 1024,
+                 ttl=DEFAULT_TTL_DAYS * 86400):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connection() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+            """)
+            db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def _connection(self):
+        """One connection per thread - sqlite3 connections must not be shared between threads"""
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=5.0)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    @staticmethod
+    def make_key(namespace, version, payload):
+        """Versioned key: schema, namespace, namespace version and a hash of the JSON-encoded inputs"""
+        digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        return f"v{CACHE_SCHEMA}:{namespace}:{version}:{digest}"
+
+    def get(self, key, default=None):
+        now = time.time()
+        try:
+            db = self._connection()
+            row = db.execute("SELECT value, created, accessed FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return default
+            if now - row[2] > TOUCH_INTERVAL:
+                with db:
+                    db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            value = pickle.loads(zlib.decompress(row[0]))
+        except (sqlite3.Error, pickle.UnpicklingError, zlib.error, EOFError):
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        namespace = key.split(':', 2)[1]
+        now = time.time()
+        try:
+            blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+            db = self._connection()
+            with db:
+                db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                           (key, namespace, blob, len(blob), now, now))
+            self._writes += 1
+            if self._writes % EVICT_EVERY == 0:
+                self.evict()
+        except (sqlite3.Error, pickle.PicklingError, TypeError, AttributeError):
+            pass
+
+    def get_or_compute(self, namespace, version, payload, compute):
+        """Cached result for payload, computing and storing it on a miss"""
+        key = self.make_key(namespace, version, payload)
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    def evict(self):
+        """Drop expired entries, then least-recently-used ones until under 90% of the size budget"""
+        try:
+            db = self._connection()
+            with db:
+                db.execute("DELETE FROM entries WHERE created < ?", (time.time() - self.ttl,))
+                total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                if total <= self.max_bytes:
+                    return
+                excess = total - int(self.max_bytes * 0.9)
+                freed = 0
+                victims = []
+                for key, size in db.execute("SELECT key, size FROM entries ORDER BY accessed"):
+                    victims.append((key,))
+                    freed += size
+                    if freed >= excess:
+                        break
+                db.executemany("DELETE FROM entries WHERE key = ?", victims)
+        except sqlite3.Error:
+            pass
+
+    def clear(self, namespace=None):
+        with self._connection() as db:
+            if namespace is None:
+                db.execute("DELETE FROM entries")
+            else:
+                db.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+
+    def stats(self):
+        """Entry count and bytes per namespace, plus this process's hits and misses"""
+        try:
+            rows = self._connection().execute(
+                "SELECT namespace, COUNT(*), SUM(size) FROM entries GROUP BY namespace").fetchall()
+        except sqlite3.Error:
+            rows = []
+        return {
+            'namespaces': {namespace: {'entries': count, 'bytes': size} for namespace, count, size in rows},
+            'entries': sum(row[1] for row in rows),
+            'bytes': sum(row[2] for row in rows),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache():
+    """Process-wide SharedCache configured from the environment, or None when disabled.
+
+    AICRETE_SHARED_CACHE: database path, or "off" to disable (default .cache/shared_cache.sqlite3)
+    AICRETE_SHARED_CACHE_MB: size budget in MB (default 256)
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                path = os.environ.get("AICRETE_SHARED_CACHE", DEFAULT_PATH)
+                if path.lower() in ("off", "0", "false", "no"):
+                    _shared_cache = False
+                else:
+                    max_mb = float(os.environ.get("AICRETE_SHARED_CACHE_MB", DEFAULT_MAX_MB))
+                    try:
+                        _shared_cache = SharedCache(path, max_bytes=int(max_mb * 1024 * 1024))
+                    except (OSError, sqlite3.Error):
+                        _shared_cache = False  # read-only or unavailable disk - run without it
+    return _shared_cache or None
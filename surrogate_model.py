@@ -0,0 +1,179 @@
+"""
+Surrogate Model Module for AIcrete UHPC Project
+Copyright 2025 Shiksha Seechurn / AIcrete
+
+This module provides fast emulators of the full property model over a
+feasible mix box, so optimizers, Monte Carlo and sensitivity loops stay
+interactive however expensive the underlying model becomes. Every
+surrogate carries error bounds measured against the full model, and
+candidate designs found on the surrogate are verified on the full model.
+"""
+
+import warnings
+from itertools import combinations_with_replacement
+
+import numpy as np
+import pandas as pd
+from numpy.polynomial import legendre
+from scipy.stats import qmc
+
+
+def _sampler(engine_class, dimensions, seed):
+    """QMC engine across SciPy versions (rng= since 1.15, seed= before)"""
+    try:
+        return engine_class(dimensions, rng=seed)
+    except TypeError:
+        return engine_class(dimensions, seed=seed)
+
+
+class PropertySurrogate:
+    """
+    Polynomial-chaos or Gaussian-process emulator of a batch property model
+    """
+
+    def __init__(self, model_fn, bounds, fixed=None, properties=None, method='polynomial', degree=2):
+        # model_fn: DataFrame of mixes -> DataFrame of properties (e.g. predict_properties_batch)
+        self.model_fn = model_fn
+        self.params = list(bounds.keys())
+        self.lower = np.array([bounds[p][0] for p in self.params], dtype=float)
+        self.upper = np.array([bounds[p][1] for p in self.params], dtype=float)
+        self.fixed = dict(fixed or {})
+        self.properties = properties
+        self.method = method
+        self.degree = degree
+        self.models = {}
+        self.error_bounds = None
+        self.n_model_runs = 0
+
+    def _mixes(self, design):
+        """Full mix DataFrame from a design matrix over the varied parameters"""
+        mixes = pd.DataFrame(design, columns=self.params)
+        for key, value in self.fixed.items():
+            if key not in mixes:
+                mixes[key] = value
+        return mixes
+
+    def _evaluate(self, design):
+        """Run the full model on a design matrix"""
+        self.n_model_runs += len(design)
+        predictions = self.model_fn(self._mixes(design))
+        if self.properties is None:
+            self.properties = list(predictions.columns)
+        return predictions[self.properties].to_numpy(dtype=float)
+
+    def _unit(self, design):
+        """Scale a design matrix onto [-1, 1] per parameter"""
+        return 2 * (np.asarray(design, dtype=float) - self.lower) / (self.upper - self.lower) - 1
+
+    def _basis(self, x):
+        """Total-degree tensor Legendre basis - orthogonal for uniform inputs on the box"""
+        n, d = x.shape
+        # values[j, k] = P_k(x_j) for every sample, parameter and degree
+        values = np.stack([legendre.legval(x, np.eye(self.degree + 1)[k]) for k in range(self.degree + 1)], axis=-1)
+        columns = [np.ones(n)]
+        for order in range(1, self.degree + 1):
+            for combo in combinations_with_replacement(range(d), order):
+                counts = np.bincount(combo, minlength=d)
+                column = np.ones(n)
+                for dim in np.nonzero(counts)[0]:
+                    column = column * values[:, dim, counts[dim]]
+                columns.append(column)
+        return np.column_stack(columns)
+
+    def fit(self, n_train=512, n_validation=256, seed=None):
+        """Fit on a Sobol design and measure error bounds on an independent Latin hypercube"""
+        train_seed, validation_seed = np.random.SeedSequence(seed).spawn(2)
+        n_train = 1 << max(int(n_train) - 1, 0).bit_length()
+        train = qmc.scale(_sampler(qmc.Sobol, len(self.params), np.random.default_rng(train_seed)).random(n_train),
+                          self.lower, self.upper)
+        y_train = self._evaluate(train)
+
+        if self.method == 'gp':
+            from sklearn.gaussian_process import GaussianProcessRegressor
+            from sklearn.gaussian_process.kernels import ConstantKernel, RBF, WhiteKernel
+            from sklearn.exceptions import ConvergenceWarning
+
+            for j, prop in enumerate(self.properties):
+                if np.ptp(y_train[:, j]) == 0:
+                    # Constant response - nothing to learn
+                    self.models[prop] = float(y_train[0, j])
+                    continue
+                kernel = ConstantKernel() * RBF(length_scale=np.ones(len(self.params))) + WhiteKernel()
+                gp = GaussianProcessRegressor(kernel=kernel, normalize_y=True)
+                with warnings.catch_warnings():
+                    # Length scales pinned at their bounds just mean an irrelevant parameter
+                    warnings.simplefilter('ignore', ConvergenceWarning)
+                    self.models[prop] = gp.fit(self._unit(train), y_train[:, j])
+        else:
+            basis = self._basis(self._unit(train))
+            coefficients = np.linalg.lstsq(basis, y_train, rcond=None)[0]
+            self.models = {prop: coefficients[:, j] for j, prop in enumerate(self.properties)}
+
+        # Error bounds against the full model on points the fit never saw
+        validation = qmc.scale(_sampler(qmc.LatinHypercube, len(self.params), np.random.default_rng(validation_seed))
+                               .random(n_validation), self.lower, self.upper)
+        errors = np.abs(self.predict(validation).to_numpy() - self._evaluate(validation))
+        y_range = np.ptp(y_train, axis=0)
+        self.error_bounds = pd.DataFrame({
+            'rmse': np.sqrt(np.mean(errors ** 2, axis=0)),
+            'p95_abs_error': np.percentile(errors, 95, axis=0),
+            'max_abs_error': errors.max(axis=0),
+            'relative_rmse': np.sqrt(np.mean(errors ** 2, axis=0)) / np.where(y_range > 0, y_range, 1)
+        }, index=self.properties)
+        return self
+
+    def in_domain(self, mixes):
+        """Boolean mask of mixes inside the box the surrogate was fitted on"""
+        design = self._design(mixes)
+        return np.all((design >= self.lower) & (design <= self.upper), axis=1)
+
+    def _design(self, mixes):
+        if isinstance(mixes, pd.DataFrame):
+            return mixes[self.params].to_numpy(dtype=float)
+        return np.atleast_2d(np.asarray(mixes, dtype=float))
+
+    def predict(self, mixes, return_std=False):
+        """Emulated properties for a DataFrame of mixes (or a design matrix over self.params)"""
+        if not self.models:
+            raise RuntimeError("Surrogate has not been fitted - call fit() first")
+        x = self._unit(self._design(mixes))
+        index = mixes.index if isinstance(mixes, pd.DataFrame) else None
+
+        if self.method == 'gp':
+            outputs = []
+            for prop in self.properties:
+                model = self.models[prop]
+                if isinstance(model, float):
+                    constant = np.full(len(x), model)
+                    outputs.append((constant, np.zeros(len(x))) if return_std else constant)
+                else:
+                    outputs.append(model.predict(x, return_std=return_std))
+            if return_std:
+                means = pd.DataFrame({p: o[0] for p, o in zip(self.properties, outputs)}, index=index)
+                stds = pd.DataFrame({p: o[1] for p, o in zip(self.properties, outputs)}, index=index)
+                return means, stds
+            return pd.DataFrame(dict(zip(self.properties, outputs)), index=index)
+
+        basis = self._basis(x)
+        predictions = pd.DataFrame({prop: basis @ self.models[prop] for prop in self.properties}, index=index)
+        if return_std:
+            # Polynomial chaos has no pointwise variance - report the validation RMSE
+            stds = pd.DataFrame({prop: np.full(len(basis), self.error_bounds.loc[prop, 'rmse'])
+                                 for prop in self.properties}, index=index)
+            return predictions, stds
+        return predictions
+
+    def verify(self, mixes):
+        """Final verification pass: compare surrogate and full model on candidate mixes"""
+        design = self._design(mixes)
+        surrogate = self.predict(design)
+        full = pd.DataFrame(self._evaluate(design), columns=self.properties)
+
+        report = pd.DataFrame(index=range(len(design)))
+        for prop in self.properties:
+            report[f'{prop}_surrogate'] = surrogate[prop].to_numpy()
+            report[f'{prop}_full'] = full[prop].to_numpy()
+            report[f'{prop}_within_bound'] = (np.abs(full[prop] - surrogate[prop])
+                                              <= self.error_bounds.loc[prop, 'max_abs_error'])
+        report['in_domain'] = self.in_domain(design)
+        return report
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Warm-up of the AIcrete server state from the command line
+
+Runs the same stages the app runs in a background thread at boot (heavy imports,
+model artifacts, SHAP explainer and report charts), prints how long each took
+and exits non-zero if any stage failed. Run it after a deploy to build the
+on-disk artifacts and check every stage before traffic arrives.
+
+    python warmup.py
+    python warmup.py --stages shap reports
+"""
+
+import argparse
+import sys
+import time
+
+start = time.perf_counter()
+from aicrete_app import warm_up, WARMUP_STAGES
+import_seconds = time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Preload AIcrete models and caches")
+    parser.add_argument('--stages', nargs='+', choices=WARMUP_STAGES, help="only run these stages")
+    args = parser.parse_args(argv)
+
+    print(f"🔥 {'app import':<12} {import_seconds * 1000:>9.0f} ms")
+    status = warm_up(args.stages)
+    for stage, seconds in status['stages'].items():
+        marker = "❌" if stage in status['errors'] else "🔥"
+        print(f"{marker} {stage:<12} {seconds * 1000:>9.0f} ms  {status['errors'].get(stage, '')}")
+
+    if status['errors']:
+        print(f"\n❌ Warm-up failed: {', '.join(status['errors'])}")
+        return 1
+    print("\n✅ Ready")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())